@@ -2,25 +2,38 @@
 Service for parsing code and extracting definitions.
 """
 import os
-from typing import Dict, List, Optional
+from dataclasses import replace
+from hashlib import blake2b
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 from ..types.file_types import CodeDefinition
+from .parsers import parser_registry as shared_parser_registry
 from .parsers.registry import ParserRegistry
 
+if TYPE_CHECKING:
+    from .cache_service import CacheService
+
 
 class CodeParserService:
     """
     Service for parsing code and extracting definitions.
     """
 
-    def __init__(self, parser_registry: Optional[ParserRegistry] = None):
+    def __init__(self, parser_registry: Optional[ParserRegistry] = None,
+                 cache_service: Optional["CacheService"] = None):
         """
         Initialize the CodeParserService.
 
         Args:
-            parser_registry: The parser registry to use. If None, a new instance will be created.
+            parser_registry: The parser registry to use. If None, the shared
+                registry with all built-in parsers is used.
+            cache_service: An optional CacheService. When given, parse
+                results are also persisted to its disk cache keyed by
+                content digest, so unchanged files skip parsing across
+                process runs, not just within one.
         """
-        self._parser_registry = parser_registry or ParserRegistry()
+        self._parser_registry = parser_registry or shared_parser_registry
+        self._cache_service = cache_service
 
     def extract_definitions(self, file_path: str) -> List[CodeDefinition]:
         """
@@ -32,36 +45,146 @@ class CodeParserService:
         Returns:
             List[CodeDefinition]: A list of code definitions.
         """
-        if not os.path.isfile(file_path):
+        parser = self._get_parser_for(file_path)
+        if not parser:
+            return []
+
+        content = self._read_content(file_path)
+        if content is None:
+            return []
+
+        # The persistent cache is keyed by content digest, so entries for
+        # unchanged files never go stale and survive process restarts
+        cache_key = None
+        if self._cache_service is not None:
+            digest = blake2b(content.encode("utf-8", "surrogatepass"), digest_size=16).hexdigest()
+            cache_key = f"definitions:{type(parser).__name__}:{file_path}:{digest}"
+            cached = self._cache_service.get(cache_key)
+            if cached is not None:
+                return self._copy_definitions(cached)
+
+        try:
+            definitions = parser.parse_cached(content, file_path)
+        except Exception as e:
+            print(f"Error extracting definitions from {file_path}: {e}")
             return []
 
+        if cache_key is not None:
+            self._cache_service.set(cache_key, definitions)
+            # Hand the caller copies so later mutation cannot reach the
+            # objects held by the in-memory tier of the cache
+            return self._copy_definitions(definitions)
+
+        return definitions
+
+    @staticmethod
+    def _copy_definitions(definitions: List[CodeDefinition]) -> List[CodeDefinition]:
+        """
+        Copy cached definitions for hand-out.
+
+        Args:
+            definitions: The cached definitions.
+
+        Returns:
+            List[CodeDefinition]: Copies safe for the caller to mutate.
+        """
+        return [
+            replace(definition, children=list(definition.children), metadata=dict(definition.metadata))
+            for definition in definitions
+        ]
+
+    def extract_definitions_many(self, file_paths: List[str], max_workers: Optional[int] = None) -> List[List[CodeDefinition]]:
+        """
+        Extract code definitions from many files.
+
+        File contents are read in the parent process, then each parser's
+        batch goes through BaseParser.parse_many, which fans large batches
+        out to worker processes; parsing is CPU-bound and embarrassingly
+        parallel across files.
+
+        Args:
+            file_paths: The paths of the files.
+            max_workers: The number of worker processes. If None, the
+                executor's default is used.
+
+        Returns:
+            List[List[CodeDefinition]]: One definition list per file, in
+                input order.
+        """
+        results: List[List[CodeDefinition]] = [[] for _ in file_paths]
+
+        # Group readable files by parser so each batch is homogeneous
+        batches: Dict[str, Tuple[object, List[int], List[Tuple[str, str]]]] = {}
+        for index, file_path in enumerate(file_paths):
+            parser = self._get_parser_for(file_path)
+            if not parser:
+                continue
+            content = self._read_content(file_path)
+            if content is None:
+                continue
+            key = type(parser).__name__
+            if key not in batches:
+                batches[key] = (parser, [], [])
+            _, indices, items = batches[key]
+            indices.append(index)
+            items.append((content, file_path))
+
+        for parser, indices, items in batches.values():
+            try:
+                parsed = parser.parse_many(items, max_workers=max_workers)
+            except Exception as e:
+                print(f"Error extracting definitions with {type(parser).__name__}: {e}")
+                continue
+            for index, definitions in zip(indices, parsed):
+                results[index] = definitions
+
+        return results
+
+    def _get_parser_for(self, file_path: str):
+        """
+        Get the parser for a file, by extension.
+
+        Args:
+            file_path: The path to the file.
+
+        Returns:
+            Optional[BaseParser]: The parser, or None if the file does not
+                exist or has no registered parser.
+        """
+        if not os.path.isfile(file_path):
+            return None
+
         # Get the file extension
         _, ext = os.path.splitext(file_path)
         ext = ext.lstrip(".").lower()
 
-        # Get the parser for the file extension
-        parser = self._parser_registry.get_parser(ext)
-        if not parser:
-            return []
+        return self._parser_registry.get_parser(ext)
 
+    @staticmethod
+    def _read_content(file_path: str) -> Optional[str]:
+        """
+        Read the content of a file, with an encoding fallback.
+
+        Args:
+            file_path: The path to the file.
+
+        Returns:
+            Optional[str]: The content, or None if the file cannot be read.
+        """
         try:
             with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-            
-            return parser.parse(content, file_path)
+                return f.read()
         except UnicodeDecodeError:
             try:
                 # Try with a different encoding
                 with open(file_path, "r", encoding="latin-1") as f:
-                    content = f.read()
-                
-                return parser.parse(content, file_path)
+                    return f.read()
             except Exception as e:
-                print(f"Error extracting definitions from {file_path}: {e}")
-                return []
+                print(f"Error reading {file_path}: {e}")
+                return None
         except Exception as e:
-            print(f"Error extracting definitions from {file_path}: {e}")
-            return []
+            print(f"Error reading {file_path}: {e}")
+            return None
 
     def get_supported_extensions(self) -> List[str]:
         """
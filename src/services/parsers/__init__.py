@@ -1,20 +1,21 @@
 """
 Package for code parsers.
 """
-from .registry import ParserRegistry
+from .registry import ParserRegistry, parser_registry
 from .base import BaseParser
 
 # Import all parsers to register them
 from . import python_parser
 from . import javascript_parser
+from . import typescript_parser
 from . import java_parser
 from . import c_parser
 from . import go_parser
 from . import ruby_parser
 from . import php_parser
 from . import rust_parser
+from . import swift_parser
+from . import kotlin_parser
+from . import scala_parser
 
-# Create and export the parser registry
-parser_registry = ParserRegistry()
-
-__all__ = ["parser_registry", "BaseParser"]
+__all__ = ["parser_registry", "ParserRegistry", "BaseParser"]
@@ -3,16 +3,182 @@ Base parser class for code parsing.
 """
 import re
 from abc import ABC, abstractmethod
-from typing import List, Optional, Pattern, Tuple
+from bisect import bisect_left
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from hashlib import blake2b
+from typing import Dict, Iterator, List, Optional, Pattern, Tuple
 
 from ...types.file_types import CodeDefinition
 
 
+# Bounded LRU of parse results, shared across parser instances and keyed by
+# (parser class, file path, content digest). Re-parsing an unchanged file is
+# the common case in watch-style indexing, and hashing the content is orders
+# of magnitude cheaper than a full parse.
+_PARSE_CACHE: "OrderedDict[Tuple[str, str, bytes], List[CodeDefinition]]" = OrderedDict()
+_PARSE_CACHE_MAX_SIZE = 1024
+
+# Batches smaller than this are parsed serially; process startup and
+# pickling cost more than the parse itself for a handful of files.
+_PARALLEL_MIN_FILES = 8
+
+
+def _parse_item(args: "Tuple[BaseParser, str, str]") -> List[CodeDefinition]:
+    """
+    Parse one (parser, content, file_path) work item.
+
+    Module-level so it can be pickled into worker processes.
+
+    Args:
+        args: The parser, file content and file path.
+
+    Returns:
+        List[CodeDefinition]: A list of code definitions.
+    """
+    parser, content, file_path = args
+    return parser.parse(content, file_path)
+
+
+_NON_NEWLINE_RE = re.compile(r"[^\n]")
+_NEWLINE_RE = re.compile(r"\n")
+
+
+def _mask_match(match: "re.Match") -> str:
+    """
+    Build the space-filled replacement for one masked region.
+
+    Single-line regions (the overwhelmingly common case) are replaced with
+    a repeated-space string; only multi-line regions pay for the
+    newline-preserving substitution.
+
+    Args:
+        match: The match for the region to blank out.
+
+    Returns:
+        str: Spaces of the same length, with newlines preserved.
+    """
+    text = match.group(0)
+    if "\n" in text:
+        return _NON_NEWLINE_RE.sub(" ", text)
+    return " " * len(text)
+
+
+class BraceIndex:
+    """
+    Precomputed index of brace positions and nesting depth for content.
+
+    A single linear pass records every brace together with the nesting depth
+    in effect after it, so queries like "is this position inside a block?"
+    are answered with a bisect instead of rescanning everything before the
+    position for every candidate match.
+    """
+
+    def __init__(self, content: str, open_char: str = "{", close_char: str = "}"):
+        """
+        Build the index for the given content.
+
+        Args:
+            content: The content of the file.
+            open_char: The character that opens a block.
+            close_char: The character that closes a block.
+        """
+        positions: List[int] = []
+        depths: List[int] = []
+        opens: List[int] = []
+        matching = {}
+        stack: List[int] = []
+        depth = 0
+        find = content.find
+        append_position = positions.append
+        append_depth = depths.append
+        next_open = find(open_char)
+        next_close = find(close_char)
+        while next_open != -1 or next_close != -1:
+            if next_close == -1 or (next_open != -1 and next_open < next_close):
+                depth += 1
+                append_position(next_open)
+                opens.append(next_open)
+                stack.append(next_open)
+                next_open = find(open_char, next_open + 1)
+            else:
+                depth -= 1
+                append_position(next_close)
+                if stack:
+                    matching[stack.pop()] = next_close
+                next_close = find(close_char, next_close + 1)
+            append_depth(depth)
+        self._positions = positions
+        self._depths = depths
+        self._opens = opens
+        self._matching = matching
+        self._length = len(content)
+
+    def depth_at(self, position: int) -> int:
+        """
+        Get the brace nesting depth in effect at a position.
+
+        Args:
+            position: The position in the content.
+
+        Returns:
+            int: The number of unclosed blocks opened before the position.
+        """
+        idx = bisect_left(self._positions, position)
+        return self._depths[idx - 1] if idx else 0
+
+    def is_inside_block(self, position: int) -> bool:
+        """
+        Check whether a position is inside a brace block.
+
+        Args:
+            position: The position in the content.
+
+        Returns:
+            bool: True if the position is inside at least one block.
+        """
+        return self.depth_at(position) > 0
+
+    def next_open(self, position: int) -> int:
+        """
+        Get the position of the first opening brace at or after a position.
+
+        Args:
+            position: The position in the content.
+
+        Returns:
+            int: The position of the opening brace, or -1 if there is none.
+        """
+        idx = bisect_left(self._opens, position)
+        return self._opens[idx] if idx < len(self._opens) else -1
+
+    def block_end(self, open_position: int) -> int:
+        """
+        Get the position just past the brace matching an opening brace.
+
+        Mirrors BaseParser.find_block_end: for an unbalanced opening brace
+        the end of the content is returned.
+
+        Args:
+            open_position: The position of the opening brace.
+
+        Returns:
+            int: The position just past the matching closing brace.
+        """
+        close = self._matching.get(open_position)
+        return close + 1 if close is not None else self._length
+
+
 class BaseParser(ABC):
     """
     Base class for all language parsers.
     """
 
+    # Subclasses that keep no per-instance state may declare their own empty
+    # __slots__ so instances carry no __dict__.
+    __slots__ = ()
+
     def __init__(self):
         """Initialize the parser."""
         pass
@@ -31,6 +197,81 @@ class BaseParser(ABC):
         """
         pass
 
+    def iter_definitions(self, content: str, file_path: str) -> Iterator[CodeDefinition]:
+        """
+        Parse code content, yielding definitions as they are found.
+
+        The default implementation wraps parse; subclasses with a streaming
+        parse path override this to yield definitions incrementally.
+
+        Args:
+            content: The content of the file.
+            file_path: The path to the file.
+
+        Yields:
+            CodeDefinition: Each code definition, in source order.
+        """
+        yield from self.parse(content, file_path)
+
+    def parse_many(self, items: List[Tuple[str, str]], max_workers: Optional[int] = None) -> List[List[CodeDefinition]]:
+        """
+        Parse many files, using worker processes for large batches.
+
+        Parsing is CPU-bound and holds no shared state, so big batches scale
+        with cores in a process pool; small batches are parsed serially
+        because pool startup would dominate. Falls back to serial parsing if
+        a pool cannot be created.
+
+        Args:
+            items: (content, file_path) pairs to parse.
+            max_workers: The number of worker processes. If None, the
+                executor's default is used.
+
+        Returns:
+            List[List[CodeDefinition]]: One definition list per item, in
+                input order.
+        """
+        work = [(self, content, file_path) for content, file_path in items]
+        if len(work) < _PARALLEL_MIN_FILES:
+            return [_parse_item(args) for args in work]
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                return list(executor.map(_parse_item, work, chunksize=4))
+        except (OSError, ValueError):
+            # No usable process pool on this platform; parse serially
+            return [_parse_item(args) for args in work]
+
+    def parse_cached(self, content: str, file_path: str) -> List[CodeDefinition]:
+        """
+        Parse code content, memoizing results by content digest.
+
+        Results are cached per (parser class, file path, content hash) in a
+        bounded LRU, so an unchanged file costs one hash instead of a full
+        parse. Cached definitions are copied on the way out because callers
+        mutate children/metadata.
+
+        Args:
+            content: The content of the file.
+            file_path: The path to the file.
+
+        Returns:
+            List[CodeDefinition]: A list of code definitions.
+        """
+        digest = blake2b(content.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        key = (type(self).__name__, file_path, digest)
+        cached = _PARSE_CACHE.get(key)
+        if cached is None:
+            cached = self.parse(content, file_path)
+            _PARSE_CACHE[key] = cached
+            if len(_PARSE_CACHE) > _PARSE_CACHE_MAX_SIZE:
+                _PARSE_CACHE.popitem(last=False)
+        else:
+            _PARSE_CACHE.move_to_end(key)
+        return [
+            replace(definition, children=list(definition.children), metadata=dict(definition.metadata))
+            for definition in cached
+        ]
+
     @staticmethod
     def find_line_number(content: str, position: int) -> int:
         """
@@ -43,7 +284,59 @@ class BaseParser(ABC):
         Returns:
             int: The line number (1-based).
         """
-        return content[:position].count("\n") + 1
+        return content.count("\n", 0, position) + 1
+
+    @staticmethod
+    def build_line_index(content: str) -> List[int]:
+        """
+        Build a sorted list of newline offsets for the content.
+
+        Computing the index once per file lets line numbers be resolved in
+        O(log n) with line_number_at instead of rescanning the content for
+        every definition.
+
+        Args:
+            content: The content of the file.
+
+        Returns:
+            List[int]: The offset of every newline character, in order.
+        """
+        # A finditer-driven comprehension keeps the per-newline work inside
+        # the regex engine and the list building in C.
+        return [match.start() for match in _NEWLINE_RE.finditer(content)]
+
+    @staticmethod
+    def line_number_at(line_index: List[int], position: int) -> int:
+        """
+        Find the line number for a position using a precomputed line index.
+
+        Args:
+            line_index: Newline offsets from build_line_index.
+            position: The position in the content.
+
+        Returns:
+            int: The line number (1-based).
+        """
+        return bisect_left(line_index, position) + 1
+
+    @staticmethod
+    def mask_regions(content: str, pattern: Pattern[str]) -> str:
+        """
+        Replace every match of a pattern with spaces, preserving newlines.
+
+        Used to blank out string literals and comments so structural scans
+        (braces, keywords, terminators) cannot be fooled by their contents.
+        Offsets and line numbers in the masked view are identical to the
+        original content.
+
+        Args:
+            content: The content of the file.
+            pattern: The pattern matching the regions to blank out.
+
+        Returns:
+            str: The content with all matched regions replaced by spaces.
+        """
+        return pattern.sub(_mask_match, content)
 
     @staticmethod
     def extract_docstring(content: str, pattern: Pattern[str], start_pos: int) -> Optional[str]:
@@ -78,14 +371,22 @@ class BaseParser(ABC):
             int: The position of the end of the block.
         """
         count = 0
-        for i in range(start_pos, len(content)):
-            if content[i] == open_char:
+        pos = start_pos
+        length = len(content)
+        while pos < length:
+            next_close = content.find(close_char, pos)
+            if next_close == -1:
+                return length
+            next_open = content.find(open_char, pos, next_close)
+            if next_open != -1:
                 count += 1
-            elif content[i] == close_char:
+                pos = next_open + 1
+            else:
                 count -= 1
                 if count == 0:
-                    return i + 1
-        return len(content)
+                    return next_close + 1
+                pos = next_close + 1
+        return length
 
     @staticmethod
     def find_next_definition(content: str, start_pos: int, pattern: Pattern[str]) -> Tuple[int, Optional[re.Match]]:
@@ -6,7 +6,7 @@ from typing import List
 
 from ...types.file_types import CodeDefinition
 from .base import BaseParser
-from .registry import ParserRegistry
+from .registry import parser_registry
 
 
 class CParser(BaseParser):
@@ -365,6 +365,5 @@ class CppParser(CParser):
 
 
 # Register the parsers
-parser_registry = ParserRegistry()
 parser_registry.register(["c", "h"], CParser)
 parser_registry.register(["cpp", "hpp", "cc", "cxx"], CppParser)
@@ -6,6 +6,7 @@ from typing import List, Match, Optional, Tuple
 
 from ...types.file_types import CodeDefinition
 from .base import BaseParser
+from .registry import parser_registry
 
 
 class GoParser(BaseParser):
@@ -260,3 +261,7 @@ class GoParser(BaseParser):
             return "\n".join(comment_block)
         
         return None
+
+
+# Register the parser
+parser_registry.register(["go"], GoParser)
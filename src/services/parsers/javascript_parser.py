@@ -2,11 +2,12 @@
 JavaScript code parser.
 """
 import re
+import sys
 from typing import List, Optional
 
 from ...types.file_types import CodeDefinition
 from .base import BaseParser
-from .registry import ParserRegistry
+from .registry import parser_registry
 
 
 class JavaScriptParser(BaseParser):
@@ -40,6 +41,11 @@ class JavaScriptParser(BaseParser):
         Returns:
             List[CodeDefinition]: A list of code definitions.
         """
+        # Definitions of one file share the path and a handful of container
+        # names; interning them keeps a single copy per file instead of one
+        # str object per definition.
+        file_path = sys.intern(file_path)
+
         definitions = []
         
         # Find all classes
@@ -63,19 +69,24 @@ class JavaScriptParser(BaseParser):
         """
         definitions = []
         
+        # Bind hot attributes to locals; LOAD_FAST is measurably cheaper than
+        # repeated attribute lookups inside the match loop.
+        find_line_number = self.find_line_number
+        find_block_end = self.find_block_end
+        jsdoc_search = self.jsdoc_pattern.search
         for match in self.class_pattern.finditer(content):
-            class_name = match.group(1)
+            class_name = sys.intern(match.group(1))
             class_start = match.start()
-            class_line = self.find_line_number(content, class_start)
+            class_line = find_line_number(content, class_start)
             
             # Find the end of the class (matching braces)
-            class_end = self.find_block_end(content, class_start)
+            class_end = find_block_end(content, class_start)
             class_content = content[class_start:class_end]
             class_end_line = class_line + class_content.count("\n")
             
             # Extract JSDoc
             jsdoc = None
-            jsdoc_match = self.jsdoc_pattern.search(content[:class_start])
+            jsdoc_match = jsdoc_search(content[:class_start])
             if jsdoc_match and jsdoc_match.end() == class_start - 1:
                 jsdoc = jsdoc_match.group(1).strip()
             
@@ -115,22 +126,27 @@ class JavaScriptParser(BaseParser):
         """
         definitions = []
         
+        # Bind hot attributes to locals; LOAD_FAST is measurably cheaper than
+        # repeated attribute lookups inside the match loop.
+        find_line_number = self.find_line_number
+        find_block_end = self.find_block_end
+        jsdoc_search = self.jsdoc_pattern.search
         for match in self.method_pattern.finditer(class_content):
             # Get the method name from the first non-None group
             method_name = next((name for name in match.groups() if name), "anonymous")
             method_start_in_class = match.start()
             method_start = class_start + method_start_in_class
-            method_line = self.find_line_number(class_content, method_start_in_class)
+            method_line = find_line_number(class_content, method_start_in_class)
             
             # Find the end of the method (matching braces)
-            method_end_in_class = self.find_block_end(class_content, method_start_in_class)
+            method_end_in_class = find_block_end(class_content, method_start_in_class)
             method_content = class_content[method_start_in_class:method_end_in_class]
             method_end_line = method_line + method_content.count("\n")
             
             # Extract JSDoc
             jsdoc = None
             # Look for JSDoc before the method
-            jsdoc_match = self.jsdoc_pattern.search(class_content[:method_start_in_class])
+            jsdoc_match = jsdoc_search(class_content[:method_start_in_class])
             if jsdoc_match and jsdoc_match.end() == method_start_in_class - 1:
                 jsdoc = jsdoc_match.group(1).strip()
             
@@ -150,6 +166,61 @@ class JavaScriptParser(BaseParser):
         
         return definitions
 
+    def _find_expression_end(self, content: str, start: int) -> int:
+        """
+        Find the end of an arrow-function expression.
+
+        Tracks parentheses, brackets, braces and string literals so that a
+        semicolon inside a nested literal does not terminate the scan, and
+        stops at the end of the expression rather than scanning to the next
+        semicolon anywhere in the file.
+
+        Args:
+            content: The content of the file.
+            start: The position just after the "=>" token.
+
+        Returns:
+            int: The position of the end of the expression.
+        """
+        length = len(content)
+        pos = start
+
+        # Skip whitespace (including newlines) between "=>" and the body
+        while pos < length and content[pos] in " \t\r\n":
+            pos += 1
+
+        depth = 0
+        while pos < length:
+            char = content[pos]
+            if char in "([{":
+                depth += 1
+            elif char in ")]}":
+                if depth == 0:
+                    # Closing a bracket the expression didn't open, e.g. the
+                    # ")" of an enclosing call: the expression ends here
+                    return pos
+                depth -= 1
+                if depth == 0 and char == "}":
+                    # End of a block-bodied arrow function
+                    return pos + 1
+            elif char in "'\"`":
+                # Skip over the string literal
+                quote = char
+                pos += 1
+                while pos < length:
+                    if content[pos] == "\\":
+                        pos += 1
+                    elif content[pos] == quote:
+                        break
+                    pos += 1
+            elif depth == 0 and (char == ";" or char == ","):
+                return pos + 1 if char == ";" else pos
+            elif depth == 0 and char == "\n":
+                return pos
+            pos += 1
+
+        return length
+
     def _find_functions(self, content: str, file_path: str) -> List[CodeDefinition]:
         """
         Find all functions in the content.
@@ -163,28 +234,32 @@ class JavaScriptParser(BaseParser):
         """
         definitions = []
         
+        # Bind hot attributes to locals; LOAD_FAST is measurably cheaper than
+        # repeated attribute lookups inside the match loop.
+        find_line_number = self.find_line_number
+        find_block_end = self.find_block_end
+        jsdoc_search = self.jsdoc_pattern.search
         for match in self.function_pattern.finditer(content):
             # Get the function name from the first non-None group
             function_name = next((name for name in match.groups() if name), "anonymous")
             function_start = match.start()
-            function_line = self.find_line_number(content, function_start)
+            function_line = find_line_number(content, function_start)
             
             # Find the end of the function
             if "=>" in match.group(0):
-                # Arrow function
-                function_end = content.find(";", function_start)
-                if function_end == -1:
-                    function_end = len(content)
+                # Arrow function: scan to the end of the expression instead
+                # of jumping to the next semicolon anywhere in the file
+                function_end = self._find_expression_end(content, match.end())
             else:
                 # Regular function
-                function_end = self.find_block_end(content, function_start)
+                function_end = find_block_end(content, function_start)
             
             function_content = content[function_start:function_end]
             function_end_line = function_line + function_content.count("\n")
             
             # Extract JSDoc
             jsdoc = None
-            jsdoc_match = self.jsdoc_pattern.search(content[:function_start])
+            jsdoc_match = jsdoc_search(content[:function_start])
             if jsdoc_match and jsdoc_match.end() == function_start - 1:
                 jsdoc = jsdoc_match.group(1).strip()
             
@@ -205,5 +280,4 @@ class JavaScriptParser(BaseParser):
 
 
 # Register the parser
-parser_registry = ParserRegistry()
 parser_registry.register(["js", "jsx"], JavaScriptParser)
@@ -2,10 +2,108 @@
 Kotlin code parser.
 """
 import re
-from typing import List, Match, Optional, Tuple
+import sys
+from bisect import bisect_right
+from collections import deque
+from typing import Iterator, List, Match, Optional, Tuple
 
 from ...types.file_types import CodeDefinition
-from .base import BaseParser
+from .base import BaseParser, BraceIndex
+from .registry import parser_registry
+
+
+# All top-level definition kinds combined into one alternation so the content
+# is scanned once instead of once per kind. Branch order matters: "enum class"
+# must win over "class", and extension functions over plain functions. The
+# outer named group of each branch identifies the kind via match.lastgroup.
+_TOP_LEVEL_RE = re.compile(
+    r"(?P<enum>(?:public|private|protected|internal)?\s*enum\s+class\s+(?P<enum_name>\w+)(?:\s*\([^)]*\))?(?:\s*:\s*[^{\n]+)?)"
+    r"|(?P<cls>(?:public|private|protected|internal)?\s*(?:abstract|final|sealed|open)?\s*(?:data)?\s*class\s+(?P<cls_name>\w+)(?:<[^>]+>)?(?:\s*\([^)]*\))?(?:\s*:\s*[^{\n]+)?)"
+    r"|(?P<iface>(?:public|private|protected|internal)?\s*interface\s+(?P<iface_name>\w+)(?:<[^>]+>)?(?:\s*:\s*[^{\n]+)?)"
+    r"|(?P<obj>(?:public|private|protected|internal)?\s*object\s+(?P<obj_name>\w+)(?:\s*:\s*[^{\n]+)?)"
+    r"|(?P<extfun>(?:public|private|protected|internal)?\s*(?:inline|suspend)?\s*fun\s+(?P<extfun_receiver>[^.\n]+)\.(?P<extfun_name>\w+)\s*\([^)]*\)(?:\s*:\s*[^{\n]+)?)"
+    r"|(?P<fun>(?:public|private|protected|internal)?\s*(?:inline|suspend)?\s*fun\s+(?:<[^>]+>\s+)?(?P<fun_name>\w+)\s*\([^)]*\)(?:\s*:\s*[^{\n]+)?)"
+    r"|(?P<alias>(?:public|private|protected|internal)?\s*typealias\s+(?P<alias_name>\w+)(?:<[^>]+>)?\s*=)"
+    r"|(?P<prop>(?:public|private|protected|internal)?\s*(?:val|var)\s+(?P<prop_name>\w+)\s*(?::\s*[^=\n]+)?(?:\s*=\s*[^{;\n]+)?)"
+)
+
+# Patterns still used to scan container bodies for members.
+_FUNCTION_RE = re.compile(r"(?:public|private|protected|internal)?\s*(?:inline|suspend)?\s*fun\s+(?:<[^>]+>\s+)?(\w+)\s*\(([^)]*)\)(?:\s*:\s*[^{]+)?")
+_PROPERTY_RE = re.compile(r"(?:public|private|protected|internal)?\s*(?:val|var)\s+(\w+)\s*(?::\s*[^=]+)?(?:\s*=\s*[^{;]+)?")
+_COMPANION_RE = re.compile(r"companion\s+object(?:\s+(\w+))?")
+# Nearest statement terminator, found with one search instead of separate
+# find() calls per terminator character.
+_PROPERTY_TERM_RE = re.compile(r"[;{\n]")
+_TYPEALIAS_TERM_RE = re.compile(r"[;\n]")
+# Cheap prescreen: a file with none of these keywords cannot contain any
+# definition this parser extracts.
+_KEYWORD_RE = re.compile(r"\b(?:class|interface|object|fun|val|var|typealias)\b")
+
+
+def _iter_kdocs(content: str) -> Iterator[Tuple[int, int, str]]:
+    """
+    Iterate over every KDoc block in the content.
+
+    Fixed-delimiter scanning with str.find beats the lazy DOTALL regex the
+    parser used before, and cannot backtrack on malformed input.
+
+    Args:
+        content: The content of the file.
+
+    Yields:
+        Tuple[int, int, str]: The start offset, end offset and inner text of
+            each KDoc block, in order.
+    """
+    find = content.find
+    pos = 0
+    while True:
+        start = find("/**", pos)
+        if start == -1:
+            return
+        close = find("*/", start + 3)
+        if close == -1:
+            return
+        end = close + 2
+        yield start, end, content[start + 3:close]
+        pos = end
+
+
+# Regions blanked out before structural matching: string and character
+# literals and comments. Offsets are preserved by mask_regions.
+_MASK_RE = re.compile(
+    r'"""[\s\S]*?"""'
+    r'|"(?:\\.|[^"\\\n])*"'
+    r"|'(?:\\.|[^'\\\n])*'"
+    r'|//[^\n]*'
+    r'|/\*[\s\S]*?\*/'
+)
+_INLINE_COMMENT_RE = re.compile(r'//\s*(.*?)$', re.MULTILINE)
+
+# Alternation branch name -> emitted definition type for container kinds.
+_CONTAINER_TYPES = {
+    "cls": "class",
+    "iface": "interface",
+    "obj": "object",
+    "enum": "enum",
+}
+
+
+def _definition_start(match: "Match") -> int:
+    """
+    Get the true start of a matched definition.
+
+    The alternation branches begin with optional modifier groups and \\s*,
+    so a match can start on whitespace (or masked comment bytes) before the
+    definition itself; skip past it.
+
+    Args:
+        match: A match from one of the definition patterns.
+
+    Returns:
+        int: The position of the first non-whitespace character of the match.
+    """
+    text = match.group(0)
+    return match.start() + (len(text) - len(text.lstrip()))
 
 
 class KotlinParser(BaseParser):
@@ -13,21 +111,9 @@ class KotlinParser(BaseParser):
     Parser for Kotlin code.
     """
 
-    def __init__(self):
-        """Initialize the Kotlin parser."""
-        super().__init__()
-        self.class_pattern = re.compile(r"(?:public|private|protected|internal)?\s*(?:abstract|final|sealed|open)?\s*(?:data)?\s*class\s+(\w+)(?:<[^>]+>)?(?:\s*\([^)]*\))?(?:\s*:\s*([^{]+))?")
-        self.interface_pattern = re.compile(r"(?:public|private|protected|internal)?\s*interface\s+(\w+)(?:<[^>]+>)?(?:\s*:\s*([^{]+))?")
-        self.object_pattern = re.compile(r"(?:public|private|protected|internal)?\s*object\s+(\w+)(?:\s*:\s*([^{]+))?")
-        self.enum_pattern = re.compile(r"(?:public|private|protected|internal)?\s*enum\s+class\s+(\w+)(?:\s*\([^)]*\))?(?:\s*:\s*([^{]+))?")
-        self.function_pattern = re.compile(r"(?:public|private|protected|internal)?\s*(?:inline|suspend)?\s*fun\s+(?:<[^>]+>\s+)?(\w+)\s*\(([^)]*)\)(?:\s*:\s*[^{]+)?")
-        self.property_pattern = re.compile(r"(?:public|private|protected|internal)?\s*(?:val|var)\s+(\w+)\s*(?::\s*[^=]+)?(?:\s*=\s*[^{;]+)?")
-        self.companion_pattern = re.compile(r"companion\s+object(?:\s+(\w+))?")
-        self.extension_function_pattern = re.compile(r"(?:public|private|protected|internal)?\s*(?:inline|suspend)?\s*fun\s+([^.]+)\.(\w+)\s*\(([^)]*)\)(?:\s*:\s*[^{]+)?")
-        self.typealias_pattern = re.compile(r"(?:public|private|protected|internal)?\s*typealias\s+(\w+)(?:<[^>]+>)?\s*=")
-        self.docstring_pattern = re.compile(r'\/\*\*(.*?)\*\/', re.DOTALL)
-        self.kdoc_pattern = re.compile(r'\/\*\*(.*?)\*\/', re.DOTALL)
-        self.inline_comment_pattern = re.compile(r'//\s*(.*?)$', re.MULTILINE)
+    # All patterns live at module level and parses carry their state in
+    # locals, so instances need no attribute storage at all.
+    __slots__ = ()
 
     def parse(self, content: str, file_path: str) -> List[CodeDefinition]:
         """
@@ -40,543 +126,383 @@ class KotlinParser(BaseParser):
         Returns:
             List[CodeDefinition]: A list of code definitions.
         """
-        definitions = []
-        
-        # Find all classes
-        definitions.extend(self._find_classes(content, file_path))
-        
-        # Find all interfaces
-        definitions.extend(self._find_interfaces(content, file_path))
-        
-        # Find all objects
-        definitions.extend(self._find_objects(content, file_path))
-        
-        # Find all enums
-        definitions.extend(self._find_enums(content, file_path))
-        
-        # Find all functions (not methods)
-        definitions.extend(self._find_functions(content, file_path))
-        
-        # Find all extension functions
-        definitions.extend(self._find_extension_functions(content, file_path))
-        
-        # Find all top-level properties
-        definitions.extend(self._find_properties(content, file_path))
-        
-        # Find all typealiases
-        definitions.extend(self._find_typealiases(content, file_path))
-        
-        return definitions
-
-    def _find_classes(self, content: str, file_path: str) -> List[CodeDefinition]:
-        """
-        Find all classes in the content.
-
-        Args:
-            content: The content of the file.
-            file_path: The path to the file.
+        return list(self.iter_definitions(content, file_path))
 
-        Returns:
-            List[CodeDefinition]: A list of class definitions.
+    def iter_definitions(self, content: str, file_path: str) -> Iterator[CodeDefinition]:
         """
-        definitions = []
-        
-        for match in self.class_pattern.finditer(content):
-            class_name = match.group(1)
-            class_start = match.start()
-            class_line = self.find_line_number(content, class_start)
-            
-            # Find the opening brace
-            opening_brace = content.find("{", class_start)
-            if opening_brace == -1:
-                continue
-            
-            # Find the end of the class (matching braces)
-            class_end = self.find_block_end(content, opening_brace, "{", "}")
-            class_content = content[class_start:class_end]
-            class_end_line = class_line + class_content.count("\n")
-            
-            # Extract docstring
-            docstring = self._extract_kotlin_docstring(content, class_start)
-            
-            # Create class definition
-            class_def = CodeDefinition(
-                name=class_name,
-                type="class",
-                file_path=file_path,
-                line_number=class_line,
-                end_line_number=class_end_line,
-                signature=match.group(0),
-                docstring=docstring
-            )
-            
-            # Find all methods in the class
-            methods = self._find_methods(class_content, file_path, class_name, class_start)
-            for method in methods:
-                class_def.children.append(method.name)
-                definitions.append(method)
-            
-            # Find all properties in the class
-            properties = self._find_class_properties(class_content, file_path, class_name, class_start)
-            for prop in properties:
-                class_def.children.append(prop.name)
-                definitions.append(prop)
-            
-            # Find companion objects in the class
-            companions = self._find_companion_objects(class_content, file_path, class_name, class_start)
-            for companion in companions:
-                class_def.children.append(companion.name)
-                definitions.append(companion)
-            
-            definitions.append(class_def)
-        
-        return definitions
+        Parse Kotlin code, yielding definitions as they are found.
 
-    def _find_interfaces(self, content: str, file_path: str) -> List[CodeDefinition]:
-        """
-        Find all interfaces in the content.
+        Streaming consumers get their first definition before the file is
+        fully processed, and peak memory tracks one top-level definition
+        plus its members rather than the whole file's output.
 
         Args:
             content: The content of the file.
             file_path: The path to the file.
 
-        Returns:
-            List[CodeDefinition]: A list of interface definitions.
+        Yields:
+            CodeDefinition: Each code definition, in source order.
         """
-        definitions = []
-        
-        for match in self.interface_pattern.finditer(content):
-            interface_name = match.group(1)
-            interface_start = match.start()
-            interface_line = self.find_line_number(content, interface_start)
-            
-            # Find the opening brace
-            opening_brace = content.find("{", interface_start)
-            if opening_brace == -1:
-                continue
-            
-            # Find the end of the interface (matching braces)
-            interface_end = self.find_block_end(content, opening_brace, "{", "}")
-            interface_content = content[interface_start:interface_end]
-            interface_end_line = interface_line + interface_content.count("\n")
-            
-            # Extract docstring
-            docstring = self._extract_kotlin_docstring(content, interface_start)
-            
-            # Create interface definition
-            interface_def = CodeDefinition(
-                name=interface_name,
-                type="interface",
-                file_path=file_path,
-                line_number=interface_line,
-                end_line_number=interface_end_line,
-                signature=match.group(0),
-                docstring=docstring
-            )
-            
-            # Find all methods in the interface
-            methods = self._find_methods(interface_content, file_path, interface_name, interface_start)
-            for method in methods:
-                interface_def.children.append(method.name)
-                definitions.append(method)
-            
-            # Find all properties in the interface
-            properties = self._find_class_properties(interface_content, file_path, interface_name, interface_start)
-            for prop in properties:
-                interface_def.children.append(prop.name)
-                definitions.append(prop)
-            
-            definitions.append(interface_def)
-        
-        return definitions
-
-    def _find_objects(self, content: str, file_path: str) -> List[CodeDefinition]:
+        # Definitions of one file share the path and a handful of container
+        # names; interning them keeps a single copy per file instead of one
+        # str object per definition.
+        file_path = sys.intern(file_path)
+
+        # Files without a single definition keyword skip the masking, the
+        # brace index and the full regex sweep entirely.
+        if _KEYWORD_RE.search(content) is None:
+            return
+
+        # Newline offsets computed once; every line-number lookup below is a
+        # bisect on this index instead of a scan over the content.
+        line_index = self.build_line_index(content)
+
+        # Structural matching runs against a masked twin of the content with
+        # strings and comments blanked out, so braces and keywords inside
+        # literals or comments cannot produce false matches. Offsets in the
+        # masked view equal offsets in the original.
+        scrubbed = self.mask_regions(content, _MASK_RE)
+
+        # Brace positions and depths indexed once; "inside a block?" checks
+        # become bisect lookups instead of counting braces from offset zero.
+        brace_index = BraceIndex(scrubbed)
+
+        # KDoc blocks indexed once; docstring lookups bisect this index for
+        # the nearest preceding block instead of rescanning the prefix.
+        kdoc_index = self._build_kdoc_index(content)
+
+        # Single pass over the content: each match is dispatched on its
+        # alternation branch instead of running eight independent sweeps.
+        # Handlers fill a small per-match batch that is drained immediately.
+        for match in _TOP_LEVEL_RE.finditer(scrubbed):
+            batch: List[CodeDefinition] = []
+            kind = match.lastgroup
+            if kind in _CONTAINER_TYPES:
+                self._handle_container(match, kind, content, scrubbed, file_path, line_index, brace_index, kdoc_index, batch)
+            elif kind == "extfun":
+                self._handle_extension_function(match, content, scrubbed, file_path, line_index, brace_index, kdoc_index, batch)
+            elif kind == "fun":
+                self._handle_function(match, content, scrubbed, file_path, line_index, brace_index, kdoc_index, batch)
+            elif kind == "prop":
+                self._handle_property(match, content, scrubbed, file_path, line_index, brace_index, kdoc_index, batch)
+            else:  # alias
+                self._handle_typealias(match, content, scrubbed, file_path, line_index, brace_index, kdoc_index, batch)
+            yield from batch
+
+    def _handle_container(self, match: Match, kind: str, content: str, scrubbed: str, file_path: str,
+                          line_index: List[int], brace_index: BraceIndex,
+                          kdoc_index: Tuple[List[int], List[str]], definitions: List[CodeDefinition]) -> None:
         """
-        Find all objects in the content.
+        Handle a class, interface, object or enum match.
 
         Args:
+            match: The top-level match for the container.
+            kind: The alternation branch name of the match.
             content: The content of the file.
+            scrubbed: The masked view of the content.
             file_path: The path to the file.
-
-        Returns:
-            List[CodeDefinition]: A list of object definitions.
+            line_index: Newline offsets for the content.
+            brace_index: Brace-depth index for the content.
+            kdoc_index: KDoc end offsets and texts for the content.
+            definitions: The list to append definitions to.
         """
-        definitions = []
-        
-        for match in self.object_pattern.finditer(content):
-            object_name = match.group(1)
-            object_start = match.start()
-            object_line = self.find_line_number(content, object_start)
-            
-            # Find the opening brace
-            opening_brace = content.find("{", object_start)
-            if opening_brace == -1:
-                continue
-            
-            # Find the end of the object (matching braces)
-            object_end = self.find_block_end(content, opening_brace, "{", "}")
-            object_content = content[object_start:object_end]
-            object_end_line = object_line + object_content.count("\n")
-            
-            # Extract docstring
-            docstring = self._extract_kotlin_docstring(content, object_start)
-            
-            # Create object definition
-            object_def = CodeDefinition(
-                name=object_name,
-                type="object",
-                file_path=file_path,
-                line_number=object_line,
-                end_line_number=object_end_line,
-                signature=match.group(0),
-                docstring=docstring
-            )
-            
-            # Find all methods in the object
-            methods = self._find_methods(object_content, file_path, object_name, object_start)
-            for method in methods:
-                object_def.children.append(method.name)
-                definitions.append(method)
-            
-            # Find all properties in the object
-            properties = self._find_class_properties(object_content, file_path, object_name, object_start)
-            for prop in properties:
-                object_def.children.append(prop.name)
-                definitions.append(prop)
-            
-            definitions.append(object_def)
-        
-        return definitions
-
-    def _find_enums(self, content: str, file_path: str) -> List[CodeDefinition]:
+        container_name = sys.intern(match.group(kind + "_name"))
+        container_start = _definition_start(match)
+        container_line = self.line_number_at(line_index, container_start)
+
+        # Find the opening brace
+        opening_brace = brace_index.next_open(container_start)
+        if opening_brace == -1:
+            return
+
+        # Find the end of the container (matching braces)
+        container_end = brace_index.block_end(opening_brace)
+        container_end_line = self.line_number_at(line_index, container_end)
+
+        # Extract docstring
+        docstring = self._extract_kotlin_docstring(content, container_start, kdoc_index)
+
+        # Create container definition
+        container_def = CodeDefinition(
+            name=container_name,
+            type=_CONTAINER_TYPES[kind],
+            file_path=file_path,
+            line_number=container_line,
+            end_line_number=container_end_line,
+            signature=content[container_start:match.end()],
+            docstring=docstring
+        )
+
+        # Find all methods in the container
+        methods = self._find_methods(content, scrubbed, container_start, container_end, file_path, container_name, line_index, brace_index, kdoc_index)
+        container_def.children.extend(method.name for method in methods)
+        definitions.extend(methods)
+
+        # Find all properties in the container
+        properties = self._find_class_properties(content, scrubbed, container_start, container_end, file_path, container_name, line_index, brace_index, kdoc_index)
+        container_def.children.extend(prop.name for prop in properties)
+        definitions.extend(properties)
+
+        # Find companion objects in classes
+        if kind == "cls":
+            companions = self._find_companion_objects(content, scrubbed, container_start, container_end, file_path, container_name, line_index, brace_index, kdoc_index)
+            container_def.children.extend(companion.name for companion in companions)
+            definitions.extend(companions)
+
+        definitions.append(container_def)
+
+    def _handle_function(self, match: Match, content: str, scrubbed: str, file_path: str, line_index: List[int],
+                         brace_index: BraceIndex,
+                          kdoc_index: Tuple[List[int], List[str]], definitions: List[CodeDefinition]) -> None:
         """
-        Find all enums in the content.
+        Handle a top-level function match.
 
         Args:
+            match: The top-level match for the function.
             content: The content of the file.
+            scrubbed: The masked view of the content.
             file_path: The path to the file.
-
-        Returns:
-            List[CodeDefinition]: A list of enum definitions.
+            line_index: Newline offsets for the content.
+            brace_index: Brace-depth index for the content.
+            kdoc_index: KDoc end offsets and texts for the content.
+            definitions: The list to append definitions to.
         """
-        definitions = []
-        
-        for match in self.enum_pattern.finditer(content):
-            enum_name = match.group(1)
-            enum_start = match.start()
-            enum_line = self.find_line_number(content, enum_start)
-            
-            # Find the opening brace
-            opening_brace = content.find("{", enum_start)
-            if opening_brace == -1:
-                continue
-            
-            # Find the end of the enum (matching braces)
-            enum_end = self.find_block_end(content, opening_brace, "{", "}")
-            enum_content = content[enum_start:enum_end]
-            enum_end_line = enum_line + enum_content.count("\n")
-            
-            # Extract docstring
-            docstring = self._extract_kotlin_docstring(content, enum_start)
-            
-            # Create enum definition
-            enum_def = CodeDefinition(
-                name=enum_name,
-                type="enum",
-                file_path=file_path,
-                line_number=enum_line,
-                end_line_number=enum_end_line,
-                signature=match.group(0),
-                docstring=docstring
-            )
-            
-            # Find all methods in the enum
-            methods = self._find_methods(enum_content, file_path, enum_name, enum_start)
-            for method in methods:
-                enum_def.children.append(method.name)
-                definitions.append(method)
-            
-            # Find all properties in the enum
-            properties = self._find_class_properties(enum_content, file_path, enum_name, enum_start)
-            for prop in properties:
-                enum_def.children.append(prop.name)
-                definitions.append(prop)
-            
-            definitions.append(enum_def)
-        
-        return definitions
-
-    def _find_functions(self, content: str, file_path: str) -> List[CodeDefinition]:
+        function_start = _definition_start(match)
+
+        # Skip if inside a class, interface, etc.
+        if brace_index.is_inside_block(function_start):
+            return
+
+        function_name = match.group("fun_name")
+        function_line = self.line_number_at(line_index, function_start)
+
+        # Find the opening brace
+        opening_brace = brace_index.next_open(function_start)
+        if opening_brace == -1:
+            # This might be a function declaration without a body
+            function_end = scrubbed.find(";", function_start)
+            if function_end == -1:
+                return
+        else:
+            # Function with a body
+            function_end = brace_index.block_end(opening_brace)
+        function_end_line = self.line_number_at(line_index, function_end)
+
+        # Extract docstring
+        docstring = self._extract_kotlin_docstring(content, function_start, kdoc_index)
+
+        definitions.append(CodeDefinition(
+            name=function_name,
+            type="function",
+            file_path=file_path,
+            line_number=function_line,
+            end_line_number=function_end_line,
+            signature=content[function_start:match.end()],
+            docstring=docstring
+        ))
+
+    def _handle_extension_function(self, match: Match, content: str, scrubbed: str, file_path: str, line_index: List[int],
+                                   brace_index: BraceIndex,
+                          kdoc_index: Tuple[List[int], List[str]], definitions: List[CodeDefinition]) -> None:
         """
-        Find all top-level functions in the content.
+        Handle an extension function match.
 
         Args:
+            match: The top-level match for the extension function.
             content: The content of the file.
+            scrubbed: The masked view of the content.
             file_path: The path to the file.
-
-        Returns:
-            List[CodeDefinition]: A list of function definitions.
-        """
-        definitions = []
-        
-        for match in self.function_pattern.finditer(content):
-            # Check if this function is inside a class, interface, etc.
-            function_start = match.start()
-            
-            # Skip if inside a class, interface, etc.
-            if self._is_inside_block(content, function_start):
-                continue
-            
-            function_name = match.group(1)
-            function_line = self.find_line_number(content, function_start)
-            
-            # Find the opening brace
-            opening_brace = content.find("{", function_start)
-            if opening_brace == -1:
-                # This might be a function declaration without a body
-                function_end = content.find(";", function_start)
-                if function_end == -1:
-                    continue
-                function_content = content[function_start:function_end+1]
-                function_end_line = function_line + function_content.count("\n")
-            else:
-                # Function with a body
-                function_end = self.find_block_end(content, opening_brace, "{", "}")
-                function_content = content[function_start:function_end]
-                function_end_line = function_line + function_content.count("\n")
-            
-            # Extract docstring
-            docstring = self._extract_kotlin_docstring(content, function_start)
-            
-            # Create function definition
-            function_def = CodeDefinition(
-                name=function_name,
-                type="function",
-                file_path=file_path,
-                line_number=function_line,
-                end_line_number=function_end_line,
-                signature=match.group(0),
-                docstring=docstring
-            )
-            
-            definitions.append(function_def)
-        
-        return definitions
-
-    def _find_extension_functions(self, content: str, file_path: str) -> List[CodeDefinition]:
-        """
-        Find all extension functions in the content.
-
-        Args:
-            content: The content of the file.
-            file_path: The path to the file.
-
-        Returns:
-            List[CodeDefinition]: A list of extension function definitions.
+            line_index: Newline offsets for the content.
+            brace_index: Brace-depth index for the content.
+            kdoc_index: KDoc end offsets and texts for the content.
+            definitions: The list to append definitions to.
         """
-        definitions = []
-        
-        for match in self.extension_function_pattern.finditer(content):
-            # Check if this function is inside a class, interface, etc.
-            function_start = match.start()
-            
-            # Skip if inside a class, interface, etc.
-            if self._is_inside_block(content, function_start):
-                continue
-            
-            receiver_type = match.group(1)
-            function_name = match.group(2)
-            function_line = self.find_line_number(content, function_start)
-            
-            # Find the opening brace
-            opening_brace = content.find("{", function_start)
-            if opening_brace == -1:
-                # This might be a function declaration without a body
-                function_end = content.find(";", function_start)
-                if function_end == -1:
-                    continue
-                function_content = content[function_start:function_end+1]
-                function_end_line = function_line + function_content.count("\n")
-            else:
-                # Function with a body
-                function_end = self.find_block_end(content, opening_brace, "{", "}")
-                function_content = content[function_start:function_end]
-                function_end_line = function_line + function_content.count("\n")
-            
-            # Extract docstring
-            docstring = self._extract_kotlin_docstring(content, function_start)
-            
-            # Create extension function definition
-            function_def = CodeDefinition(
-                name=function_name,
-                type="extension_function",
-                file_path=file_path,
-                line_number=function_line,
-                end_line_number=function_end_line,
-                signature=match.group(0),
-                docstring=docstring,
-                parent=receiver_type
-            )
-            
-            definitions.append(function_def)
-        
-        return definitions
-
-    def _find_properties(self, content: str, file_path: str) -> List[CodeDefinition]:
+        function_start = _definition_start(match)
+
+        # Skip if inside a class, interface, etc.
+        if brace_index.is_inside_block(function_start):
+            return
+
+        receiver_type = match.group("extfun_receiver")
+        function_name = match.group("extfun_name")
+        function_line = self.line_number_at(line_index, function_start)
+
+        # Find the opening brace
+        opening_brace = brace_index.next_open(function_start)
+        if opening_brace == -1:
+            # This might be a function declaration without a body
+            function_end = scrubbed.find(";", function_start)
+            if function_end == -1:
+                return
+        else:
+            # Function with a body
+            function_end = brace_index.block_end(opening_brace)
+        function_end_line = self.line_number_at(line_index, function_end)
+
+        # Extract docstring
+        docstring = self._extract_kotlin_docstring(content, function_start, kdoc_index)
+
+        definitions.append(CodeDefinition(
+            name=function_name,
+            type="extension_function",
+            file_path=file_path,
+            line_number=function_line,
+            end_line_number=function_end_line,
+            signature=content[function_start:match.end()],
+            docstring=docstring,
+            parent=receiver_type
+        ))
+
+    def _handle_property(self, match: Match, content: str, scrubbed: str, file_path: str, line_index: List[int],
+                         brace_index: BraceIndex,
+                          kdoc_index: Tuple[List[int], List[str]], definitions: List[CodeDefinition]) -> None:
         """
-        Find all top-level properties in the content.
+        Handle a top-level property match.
 
         Args:
+            match: The top-level match for the property.
             content: The content of the file.
+            scrubbed: The masked view of the content.
             file_path: The path to the file.
-
-        Returns:
-            List[CodeDefinition]: A list of property definitions.
+            line_index: Newline offsets for the content.
+            brace_index: Brace-depth index for the content.
+            kdoc_index: KDoc end offsets and texts for the content.
+            definitions: The list to append definitions to.
         """
-        definitions = []
-        
-        for match in self.property_pattern.finditer(content):
-            # Check if this property is inside a class, interface, etc.
-            property_start = match.start()
-            
-            # Skip if inside a class, interface, etc.
-            if self._is_inside_block(content, property_start):
-                continue
-            
-            property_name = match.group(1)
-            property_line = self.find_line_number(content, property_start)
-            
-            # Find the end of the property (semicolon or newline)
-            semicolon = content.find(";", property_start)
-            newline = content.find("\n", property_start)
-            opening_brace = content.find("{", property_start)
-            
-            if semicolon != -1 and (newline == -1 or semicolon < newline) and (opening_brace == -1 or semicolon < opening_brace):
-                property_end = semicolon + 1
-            elif opening_brace != -1 and (newline == -1 or opening_brace < newline):
-                # Property with a getter/setter block
-                property_end = self.find_block_end(content, opening_brace, "{", "}")
-            elif newline != -1:
-                property_end = newline
-            else:
-                property_end = len(content)
-            
-            property_content = content[property_start:property_end]
-            property_end_line = property_line + property_content.count("\n")
-            
-            # Extract docstring
-            docstring = self._extract_kotlin_docstring(content, property_start)
-            
-            # Create property definition
-            property_def = CodeDefinition(
-                name=property_name,
-                type="property",
-                file_path=file_path,
-                line_number=property_line,
-                end_line_number=property_end_line,
-                signature=property_content.strip(),
-                docstring=docstring
-            )
-            
-            definitions.append(property_def)
-        
-        return definitions
-
-    def _find_typealiases(self, content: str, file_path: str) -> List[CodeDefinition]:
+        property_start = _definition_start(match)
+
+        # Skip if inside a class, interface, etc.
+        if brace_index.is_inside_block(property_start):
+            return
+
+        property_name = match.group("prop_name")
+        property_line = self.line_number_at(line_index, property_start)
+
+        # Find the end of the property: the nearest of ";", "{" or newline
+        term = _PROPERTY_TERM_RE.search(scrubbed, property_start)
+        if term is None:
+            property_end = len(content)
+        elif term.group(0) == ";":
+            property_end = term.start() + 1
+        elif term.group(0) == "{":
+            # Property with a getter/setter block
+            property_end = brace_index.block_end(term.start())
+        else:
+            property_end = term.start()
+
+        property_content = content[property_start:property_end]
+        property_end_line = self.line_number_at(line_index, property_end)
+
+        # Extract docstring
+        docstring = self._extract_kotlin_docstring(content, property_start, kdoc_index)
+
+        definitions.append(CodeDefinition(
+            name=property_name,
+            type="property",
+            file_path=file_path,
+            line_number=property_line,
+            end_line_number=property_end_line,
+            signature=property_content.strip(),
+            docstring=docstring
+        ))
+
+    def _handle_typealias(self, match: Match, content: str, scrubbed: str, file_path: str, line_index: List[int],
+                          brace_index: BraceIndex,
+                          kdoc_index: Tuple[List[int], List[str]], definitions: List[CodeDefinition]) -> None:
         """
-        Find all type aliases in the content.
+        Handle a typealias match.
 
         Args:
+            match: The top-level match for the typealias.
             content: The content of the file.
+            scrubbed: The masked view of the content.
             file_path: The path to the file.
-
-        Returns:
-            List[CodeDefinition]: A list of type alias definitions.
+            line_index: Newline offsets for the content.
+            brace_index: Brace-depth index for the content.
+            kdoc_index: KDoc end offsets and texts for the content.
+            definitions: The list to append definitions to.
         """
-        definitions = []
-        
-        for match in self.typealias_pattern.finditer(content):
-            # Check if this typealias is inside a class, interface, etc.
-            typealias_start = match.start()
-            
-            # Skip if inside a class, interface, etc.
-            if self._is_inside_block(content, typealias_start):
-                continue
-            
-            typealias_name = match.group(1)
-            typealias_line = self.find_line_number(content, typealias_start)
-            
-            # Find the end of the typealias (semicolon or newline)
-            semicolon = content.find(";", typealias_start)
-            newline = content.find("\n", typealias_start)
-            
-            if semicolon != -1 and (newline == -1 or semicolon < newline):
-                typealias_end = semicolon + 1
-            elif newline != -1:
-                typealias_end = newline
-            else:
-                typealias_end = len(content)
-            
-            typealias_content = content[typealias_start:typealias_end]
-            typealias_end_line = typealias_line + typealias_content.count("\n")
-            
-            # Extract docstring
-            docstring = self._extract_kotlin_docstring(content, typealias_start)
-            
-            # Create typealias definition
-            typealias_def = CodeDefinition(
-                name=typealias_name,
-                type="typealias",
-                file_path=file_path,
-                line_number=typealias_line,
-                end_line_number=typealias_end_line,
-                signature=typealias_content.strip(),
-                docstring=docstring
-            )
-            
-            definitions.append(typealias_def)
-        
-        return definitions
-
-    def _find_methods(self, container_content: str, file_path: str, container_name: str, container_start: int) -> List[CodeDefinition]:
+        typealias_start = _definition_start(match)
+
+        # Skip if inside a class, interface, etc.
+        if brace_index.is_inside_block(typealias_start):
+            return
+
+        typealias_name = match.group("alias_name")
+        typealias_line = self.line_number_at(line_index, typealias_start)
+
+        # Find the end of the typealias: the nearest of ";" or newline
+        term = _TYPEALIAS_TERM_RE.search(scrubbed, typealias_start)
+        if term is None:
+            typealias_end = len(content)
+        elif term.group(0) == ";":
+            typealias_end = term.start() + 1
+        else:
+            typealias_end = term.start()
+
+        typealias_content = content[typealias_start:typealias_end]
+        typealias_end_line = self.line_number_at(line_index, typealias_end)
+
+        # Extract docstring
+        docstring = self._extract_kotlin_docstring(content, typealias_start, kdoc_index)
+
+        definitions.append(CodeDefinition(
+            name=typealias_name,
+            type="typealias",
+            file_path=file_path,
+            line_number=typealias_line,
+            end_line_number=typealias_end_line,
+            signature=typealias_content.strip(),
+            docstring=docstring
+        ))
+
+    def _find_methods(self, content: str, scrubbed: str, start: int, end: int, file_path: str,
+                      container_name: str, line_index: List[int], brace_index: BraceIndex,
+                      kdoc_index: Tuple[List[int], List[str]]) -> List[CodeDefinition]:
         """
         Find all methods in a container (class, interface, object, enum).
 
+        The container is addressed by its (start, end) span in the original
+        content rather than a sliced copy.
+
         Args:
-            container_content: The content of the container.
+            content: The content of the file.
+            scrubbed: The masked view of the content.
+            start: The start position of the container.
+            end: The end position of the container.
             file_path: The path to the file.
             container_name: The name of the container.
-            container_start: The start position of the container in the original content.
+            line_index: Newline offsets for the content.
+            brace_index: Brace-depth index for the content.
+            kdoc_index: KDoc end offsets and texts for the content.
 
         Returns:
             List[CodeDefinition]: A list of method definitions.
         """
         definitions = []
-        
-        for match in self.function_pattern.finditer(container_content):
+        append = definitions.append
+
+        for match in _FUNCTION_RE.finditer(scrubbed, start, end):
             method_name = match.group(1)
-            method_start_in_container = match.start()
-            method_start = container_start + method_start_in_container
-            method_line = self.find_line_number(container_content, method_start_in_container)
-            
+            method_start = _definition_start(match)
+            method_line = self.line_number_at(line_index, method_start)
+
             # Find the opening brace
-            opening_brace = container_content.find("{", method_start_in_container)
-            if opening_brace == -1:
+            opening_brace = brace_index.next_open(method_start)
+            if opening_brace == -1 or opening_brace >= end:
                 # This might be a method declaration without a body (in an interface)
-                method_end_in_container = container_content.find(";", method_start_in_container)
-                if method_end_in_container == -1:
+                semicolon = scrubbed.find(";", method_start, end)
+                if semicolon == -1:
                     continue
-                method_content = container_content[method_start_in_container:method_end_in_container+1]
-                method_end_line = method_line + method_content.count("\n")
+                method_end = semicolon + 1
             else:
                 # Method with a body
-                method_end_in_container = self.find_block_end(container_content, opening_brace, "{", "}")
-                method_content = container_content[method_start_in_container:method_end_in_container]
-                method_end_line = method_line + method_content.count("\n")
-            
+                method_end = min(brace_index.block_end(opening_brace), end)
+            method_end_line = self.line_number_at(line_index, method_end)
+
             # Extract docstring
-            docstring = self._extract_kotlin_docstring(container_content, method_start_in_container)
-            
+            docstring = self._extract_kotlin_docstring(content, method_start, kdoc_index)
+
             # Create method definition
             method_def = CodeDefinition(
                 name=method_name,
@@ -584,56 +510,63 @@ class KotlinParser(BaseParser):
                 file_path=file_path,
                 line_number=method_line,
                 end_line_number=method_end_line,
-                signature=match.group(0),
+                signature=content[method_start:match.end()],
                 docstring=docstring,
                 parent=container_name
             )
-            
-            definitions.append(method_def)
-        
+
+            append(method_def)
+
         return definitions
 
-    def _find_class_properties(self, container_content: str, file_path: str, container_name: str, container_start: int) -> List[CodeDefinition]:
+    def _find_class_properties(self, content: str, scrubbed: str, start: int, end: int, file_path: str,
+                               container_name: str, line_index: List[int], brace_index: BraceIndex,
+                      kdoc_index: Tuple[List[int], List[str]]) -> List[CodeDefinition]:
         """
         Find all properties in a container (class, interface, object, enum).
 
+        The container is addressed by its (start, end) span in the original
+        content rather than a sliced copy.
+
         Args:
-            container_content: The content of the container.
+            content: The content of the file.
+            scrubbed: The masked view of the content.
+            start: The start position of the container.
+            end: The end position of the container.
             file_path: The path to the file.
             container_name: The name of the container.
-            container_start: The start position of the container in the original content.
+            line_index: Newline offsets for the content.
+            brace_index: Brace-depth index for the content.
+            kdoc_index: KDoc end offsets and texts for the content.
 
         Returns:
             List[CodeDefinition]: A list of property definitions.
         """
         definitions = []
-        
-        for match in self.property_pattern.finditer(container_content):
+        append = definitions.append
+
+        for match in _PROPERTY_RE.finditer(scrubbed, start, end):
             property_name = match.group(1)
-            property_start_in_container = match.start()
-            property_line = self.find_line_number(container_content, property_start_in_container)
-            
-            # Find the end of the property (semicolon or newline)
-            semicolon = container_content.find(";", property_start_in_container)
-            newline = container_content.find("\n", property_start_in_container)
-            opening_brace = container_content.find("{", property_start_in_container)
-            
-            if semicolon != -1 and (newline == -1 or semicolon < newline) and (opening_brace == -1 or semicolon < opening_brace):
-                property_end_in_container = semicolon + 1
-            elif opening_brace != -1 and (newline == -1 or opening_brace < newline):
+            property_start = _definition_start(match)
+            property_line = self.line_number_at(line_index, property_start)
+
+            # Find the end of the property: the nearest of ";", "{" or newline
+            term = _PROPERTY_TERM_RE.search(scrubbed, property_start, end)
+            if term is None:
+                property_end = end
+            elif term.group(0) == ";":
+                property_end = term.start() + 1
+            elif term.group(0) == "{":
                 # Property with a getter/setter block
-                property_end_in_container = self.find_block_end(container_content, opening_brace, "{", "}")
-            elif newline != -1:
-                property_end_in_container = newline
+                property_end = min(brace_index.block_end(term.start()), end)
             else:
-                property_end_in_container = len(container_content)
-            
-            property_content = container_content[property_start_in_container:property_end_in_container]
-            property_end_line = property_line + property_content.count("\n")
-            
+                property_end = term.start()
+
+            property_end_line = self.line_number_at(line_index, property_end)
+
             # Extract docstring
-            docstring = self._extract_kotlin_docstring(container_content, property_start_in_container)
-            
+            docstring = self._extract_kotlin_docstring(content, property_start, kdoc_index)
+
             # Create property definition
             property_def = CodeDefinition(
                 name=property_name,
@@ -641,49 +574,58 @@ class KotlinParser(BaseParser):
                 file_path=file_path,
                 line_number=property_line,
                 end_line_number=property_end_line,
-                signature=property_content.strip(),
+                signature=content[property_start:property_end].strip(),
                 docstring=docstring,
                 parent=container_name
             )
-            
-            definitions.append(property_def)
-        
+
+            append(property_def)
+
         return definitions
 
-    def _find_companion_objects(self, class_content: str, file_path: str, class_name: str, class_start: int) -> List[CodeDefinition]:
+    def _find_companion_objects(self, content: str, scrubbed: str, start: int, end: int, file_path: str,
+                                class_name: str, line_index: List[int], brace_index: BraceIndex,
+                      kdoc_index: Tuple[List[int], List[str]]) -> List[CodeDefinition]:
         """
         Find all companion objects in a class.
 
+        The class is addressed by its (start, end) span in the original
+        content rather than a sliced copy.
+
         Args:
-            class_content: The content of the class.
+            content: The content of the file.
+            scrubbed: The masked view of the content.
+            start: The start position of the class.
+            end: The end position of the class.
             file_path: The path to the file.
             class_name: The name of the class.
-            class_start: The start position of the class in the original content.
+            line_index: Newline offsets for the content.
+            brace_index: Brace-depth index for the content.
+            kdoc_index: KDoc end offsets and texts for the content.
 
         Returns:
             List[CodeDefinition]: A list of companion object definitions.
         """
         definitions = []
-        
-        for match in self.companion_pattern.finditer(class_content):
-            companion_name = match.group(1) if match.group(1) else "Companion"
-            companion_start_in_class = match.start()
-            companion_start = class_start + companion_start_in_class
-            companion_line = self.find_line_number(class_content, companion_start_in_class)
-            
+
+        for match in _COMPANION_RE.finditer(scrubbed, start, end):
+            companion_name = sys.intern(match.group(1)) if match.group(1) else "Companion"
+            qualified_name = sys.intern(f"{class_name}.{companion_name}")
+            companion_start = _definition_start(match)
+            companion_line = self.line_number_at(line_index, companion_start)
+
             # Find the opening brace
-            opening_brace = class_content.find("{", companion_start_in_class)
-            if opening_brace == -1:
+            opening_brace = brace_index.next_open(companion_start)
+            if opening_brace == -1 or opening_brace >= end:
                 continue
-            
+
             # Find the end of the companion object (matching braces)
-            companion_end_in_class = self.find_block_end(class_content, opening_brace, "{", "}")
-            companion_content = class_content[companion_start_in_class:companion_end_in_class]
-            companion_end_line = companion_line + companion_content.count("\n")
-            
+            companion_end = min(brace_index.block_end(opening_brace), end)
+            companion_end_line = self.line_number_at(line_index, companion_end)
+
             # Extract docstring
-            docstring = self._extract_kotlin_docstring(class_content, companion_start_in_class)
-            
+            docstring = self._extract_kotlin_docstring(content, companion_start, kdoc_index)
+
             # Create companion object definition
             companion_def = CodeDefinition(
                 name=companion_name,
@@ -691,87 +633,102 @@ class KotlinParser(BaseParser):
                 file_path=file_path,
                 line_number=companion_line,
                 end_line_number=companion_end_line,
-                signature=match.group(0),
+                signature=content[companion_start:match.end()],
                 docstring=docstring,
                 parent=class_name
             )
-            
+
             # Find all methods in the companion object
-            methods = self._find_methods(companion_content, file_path, f"{class_name}.{companion_name}", companion_start)
-            for method in methods:
-                companion_def.children.append(method.name)
-                definitions.append(method)
-            
+            methods = self._find_methods(content, scrubbed, companion_start, companion_end, file_path, qualified_name, line_index, brace_index, kdoc_index)
+            companion_def.children.extend(method.name for method in methods)
+            definitions.extend(methods)
+
             # Find all properties in the companion object
-            properties = self._find_class_properties(companion_content, file_path, f"{class_name}.{companion_name}", companion_start)
-            for prop in properties:
-                companion_def.children.append(prop.name)
-                definitions.append(prop)
-            
+            properties = self._find_class_properties(content, scrubbed, companion_start, companion_end, file_path, qualified_name, line_index, brace_index, kdoc_index)
+            companion_def.children.extend(prop.name for prop in properties)
+            definitions.extend(properties)
+
             definitions.append(companion_def)
-        
+
         return definitions
 
-    def _is_inside_block(self, content: str, position: int) -> bool:
+    @staticmethod
+    def _build_kdoc_index(content: str) -> Tuple[List[int], List[str]]:
         """
-        Check if a position is inside a block (class, interface, etc.).
+        Index every KDoc block in the content.
+
+        Built once per parse so that per-definition docstring lookups are a
+        bisect over the end offsets instead of a fresh scan of everything
+        before the definition.
 
         Args:
             content: The content of the file.
-            position: The position to check.
 
         Returns:
-            bool: True if the position is inside a block, False otherwise.
+            Tuple[List[int], List[str]]: The end offset and stripped text of
+                every KDoc block, in order.
         """
-        # Count the number of opening and closing braces before the position
-        open_braces = content[:position].count("{")
-        close_braces = content[:position].count("}")
-        
-        # If there are more opening braces than closing braces, it's inside a block
-        return open_braces > close_braces
-
-    def _extract_kotlin_docstring(self, content: str, start_pos: int) -> Optional[str]:
+        ends: List[int] = []
+        texts: List[str] = []
+        for _, end, text in _iter_kdocs(content):
+            ends.append(end)
+            texts.append(text.strip())
+        return ends, texts
+
+    @staticmethod
+    def _extract_kotlin_docstring(content: str, start_pos: int, kdoc_index: Tuple[List[int], List[str]]) -> Optional[str]:
         """
         Extract a Kotlin docstring (KDoc or comment) before a definition.
 
         Args:
             content: The content of the file.
             start_pos: The position of the definition.
+            kdoc_index: KDoc end offsets and texts from _build_kdoc_index.
 
         Returns:
             Optional[str]: The extracted docstring, or None if not found.
         """
         # Find the line start
-        line_start = content[:start_pos].rfind("\n") + 1
-        if line_start < 0:
-            line_start = 0
-        
-        # Look for KDoc comments before the definition
-        kdoc_match = self.kdoc_pattern.search(content[:start_pos], re.DOTALL)
-        if kdoc_match and kdoc_match.end() > line_start - 10:  # Allow some whitespace
-            return kdoc_match.group(1).strip()
+        line_start = content.rfind("\n", 0, start_pos) + 1
+
+        # Look for the nearest KDoc comment ending just before the definition
+        ends, texts = kdoc_index
+        idx = bisect_right(ends, start_pos) - 1
+        if idx >= 0 and ends[idx] > line_start - 10:  # Allow some whitespace
+            return texts[idx]
+
+        # Fast path: no inline comment marker in a short window above the
+        # definition means the backward walk below cannot find anything
+        if content.find("//", max(0, line_start - 512), line_start) == -1:
+            return None
         
         # Look for inline comments before the definition
-        comment_block = []
+        # appendleft is O(1); inserting at the front of a list shifts the
+        # whole block on every comment line
+        comment_block = deque()
         current_pos = line_start
-        
+
         # Go backward to find comments
         while current_pos > 0:
-            prev_line_end = content[:current_pos-1].rfind("\n")
+            prev_line_end = content.rfind("\n", 0, current_pos - 1)
             if prev_line_end < 0:
                 prev_line_end = 0
-            
+
             prev_line = content[prev_line_end:current_pos-1].strip()
-            
+
             # Check if the previous line is a comment
-            inline_match = self.inline_comment_pattern.match(prev_line)
+            inline_match = _INLINE_COMMENT_RE.match(prev_line)
             if inline_match:
-                comment_block.insert(0, inline_match.group(1).strip())
+                comment_block.appendleft(inline_match.group(1).strip())
                 current_pos = prev_line_end + 1
             else:
                 break
-        
+
         if comment_block:
             return "\n".join(comment_block)
-        
+
         return None
+
+
+# Register the parser
+parser_registry.register(["kt", "kts"], KotlinParser)
@@ -2,10 +2,50 @@
 PHP code parser.
 """
 import re
+from bisect import bisect_left, bisect_right
+from collections import deque
 from typing import List, Match, Optional, Tuple
 
 from ...types.file_types import CodeDefinition
-from .base import BaseParser
+from .base import BaseParser, BraceIndex
+from .registry import parser_registry
+
+
+# All top-level definition kinds combined into one alternation so the content
+# is scanned once instead of once per kind. The outer named group of each
+# branch identifies the kind via match.lastgroup.
+_TOP_LEVEL_RE = re.compile(
+    r"(?P<cls>class\s+(?P<cls_name>\w+)(?:\s+extends\s+(\w+))?(?:\s+implements\s+([^{\n]+))?)"
+    r"|(?P<iface>interface\s+(?P<iface_name>\w+)(?:\s+extends\s+([^{\n]+))?)"
+    r"|(?P<trait>trait\s+(?P<trait_name>\w+))"
+    r"|(?P<func>\bfunction\s+(?P<func_name>\w+)\s*\(([^)]*)\))"
+)
+
+# Patterns still used to scan container bodies for members.
+# Anchored at line start so arbitrary text containing "function" cannot
+# match; modifiers may appear in any combination before the keyword.
+_METHOD_RE = re.compile(r"^[ \t]*(?:(?:public|private|protected|static|final|abstract)\s+)*function\s+(\w+)\s*\(([^)]*)\)", re.MULTILINE)
+_PROPERTY_RE = re.compile(r"(?:public|private|protected)\s+(?:static)?\s*\$(\w+)")
+_NAMESPACE_RE = re.compile(r"namespace\s+([^;]+);")
+_SEMICOLON_RE = re.compile(r";")
+# Regions blanked out before structural matching: string literals and
+# comments. Offsets are preserved by mask_regions.
+_MASK_RE = re.compile(
+    r'"(?:\\.|[^"\\])*"'
+    r"|'(?:\\.|[^'\\])*'"
+    r'|/\*[\s\S]*?\*/'
+    r'|//[^\n]*'
+    r'|#[^\n]*'
+)
+_DOCSTRING_RE = re.compile(r'/\*\*(.*?)\*/', re.DOTALL)
+_INLINE_COMMENT_RE = re.compile(r'//\s*(.*?)$', re.MULTILINE)
+
+# Alternation branch name -> emitted definition type for container kinds.
+_CONTAINER_TYPES = {
+    "cls": "class",
+    "iface": "interface",
+    "trait": "trait",
+}
 
 
 class PHPParser(BaseParser):
@@ -13,18 +53,9 @@ class PHPParser(BaseParser):
     Parser for PHP code.
     """
 
-    def __init__(self):
-        """Initialize the PHP parser."""
-        super().__init__()
-        self.class_pattern = re.compile(r"class\s+(\w+)(?:\s+extends\s+(\w+))?(?:\s+implements\s+([^{]+))?")
-        self.interface_pattern = re.compile(r"interface\s+(\w+)(?:\s+extends\s+([^{]+))?")
-        self.trait_pattern = re.compile(r"trait\s+(\w+)")
-        self.function_pattern = re.compile(r"function\s+(\w+)\s*\(([^)]*)\)")
-        self.method_pattern = re.compile(r"(?:public|private|protected)?\s*(?:static)?\s*function\s+(\w+)\s*\(([^)]*)\)")
-        self.property_pattern = re.compile(r"(?:public|private|protected)\s+(?:static)?\s*\$(\w+)")
-        self.namespace_pattern = re.compile(r"namespace\s+([^;]+);")
-        self.docstring_pattern = re.compile(r'/\*\*(.*?)\*/', re.DOTALL)
-        self.inline_comment_pattern = re.compile(r'//\s*(.*?)$', re.MULTILINE)
+    # All patterns live at module level, compiled once per process instead of
+    # once per instance, so instances need no attribute storage at all.
+    __slots__ = ()
 
     def parse(self, content: str, file_path: str) -> List[CodeDefinition]:
         """
@@ -42,17 +73,46 @@ class PHPParser(BaseParser):
         # Find namespace
         namespace = self._find_namespace(content)
         
-        # Find all classes
-        definitions.extend(self._find_classes(content, file_path, namespace))
+        # Docblocks indexed once; docstring lookups bisect this index for
+        # the nearest preceding block instead of rescanning the prefix.
+        doc_index = self._build_doc_index(content)
         
-        # Find all interfaces
-        definitions.extend(self._find_interfaces(content, file_path, namespace))
+        # Newline offsets computed once; every line-number lookup below is a
+        # bisect on this index instead of a scan over the content.
+        line_index = self.build_line_index(content)
         
-        # Find all traits
-        definitions.extend(self._find_traits(content, file_path, namespace))
+        # Structural matching runs against a masked twin of the content with
+        # strings and comments blanked out, so braces and keywords inside
+        # literals or comments cannot produce false matches. Offsets in the
+        # masked view equal offsets in the original.
+        scrubbed = self.mask_regions(content, _MASK_RE)
         
-        # Find all functions (not methods)
-        definitions.extend(self._find_functions(content, file_path, namespace))
+        # Brace positions paired once in a linear pass; every block-end
+        # lookup below is a dict hit instead of a fresh pairing scan.
+        brace_index = BraceIndex(scrubbed)
+        
+        # Statement terminators indexed once; property-end lookups bisect
+        # this instead of scanning forward through the container.
+        semicolon_index = [m.start() for m in _SEMICOLON_RE.finditer(scrubbed)]
+        
+        # Single pass over the content: each match is dispatched on its
+        # alternation branch instead of running four independent sweeps.
+        # Matches arrive in document order, so tracking the furthest
+        # container end seen so far is enough to tell methods (reported by
+        # the container scan) apart from top-level functions.
+        container_end = 0
+        for match in _TOP_LEVEL_RE.finditer(scrubbed):
+            # Anything starting inside a known container span is a member;
+            # the container's own scan reports it
+            if match.start() < container_end:
+                continue
+            kind = match.lastgroup
+            if kind == "func":
+                self._handle_function(match, content, file_path, namespace, line_index, brace_index, doc_index, definitions)
+            else:
+                end = self._handle_container(match, kind, content, scrubbed, file_path, namespace, line_index, brace_index, semicolon_index, doc_index, definitions)
+                if end > container_end:
+                    container_end = end
         
         return definitions
 
@@ -66,272 +126,166 @@ class PHPParser(BaseParser):
         Returns:
             Optional[str]: The namespace, or None if not found.
         """
-        match = self.namespace_pattern.search(content)
+        match = _NAMESPACE_RE.search(content)
         if match:
             return match.group(1).strip()
         return None
 
-    def _find_classes(self, content: str, file_path: str, namespace: Optional[str]) -> List[CodeDefinition]:
+    def _handle_container(self, match: Match, kind: str, content: str, scrubbed: str, file_path: str,
+                          namespace: Optional[str], line_index: List[int], brace_index: BraceIndex,
+                          semicolon_index: List[int], doc_index: Tuple[List[int], List[str]],
+                          definitions: List[CodeDefinition]) -> int:
         """
-        Find all classes in the content.
+        Handle a class, interface or trait match.
 
         Args:
+            match: The top-level match for the container.
+            kind: The alternation branch name of the match.
             content: The content of the file.
+            scrubbed: The masked view of the content.
             file_path: The path to the file.
             namespace: The namespace of the file.
+            line_index: Newline offsets for the content.
+            brace_index: Brace-depth index for the content.
+            semicolon_index: Semicolon offsets for the content.
+            doc_index: Docblock end offsets and texts for the content.
+            definitions: The list to append definitions to.
 
         Returns:
-            List[CodeDefinition]: A list of class definitions.
+            int: The end offset of the container body, or -1 if it has none.
         """
-        definitions = []
+        container_name = match.group(kind + "_name")
+        container_start = match.start()
+        container_line = self.line_number_at(line_index, container_start)
         
-        for match in self.class_pattern.finditer(content):
-            class_name = match.group(1)
-            class_start = match.start()
-            class_line = self.find_line_number(content, class_start)
-            
-            # Find the opening brace
-            opening_brace = content.find("{", class_start)
-            if opening_brace == -1:
-                continue
-            
-            # Find the end of the class (matching braces)
-            class_end = self.find_block_end(content, opening_brace, "{", "}")
-            class_content = content[class_start:class_end]
-            class_end_line = class_line + class_content.count("\n")
-            
-            # Extract docstring (PHP uses /** */ or // comments)
-            docstring = self._extract_php_docstring(content, class_start)
-            
-            # Create class definition
-            full_name = f"{namespace}\\{class_name}" if namespace else class_name
-            class_def = CodeDefinition(
-                name=full_name,
-                type="class",
-                file_path=file_path,
-                line_number=class_line,
-                end_line_number=class_end_line,
-                signature=match.group(0),
-                docstring=docstring
-            )
-            
-            # Find all methods in the class
-            methods = self._find_class_methods(class_content, file_path, full_name, class_start)
-            for method in methods:
-                class_def.children.append(method.name)
-                definitions.append(method)
-            
-            # Find all properties in the class
-            properties = self._find_class_properties(class_content, file_path, full_name, class_start)
-            for prop in properties:
-                class_def.children.append(prop.name)
-                definitions.append(prop)
-            
-            definitions.append(class_def)
+        # Find the opening brace
+        opening_brace = brace_index.next_open(container_start)
+        if opening_brace == -1:
+            return -1
         
-        return definitions
-
-    def _find_interfaces(self, content: str, file_path: str, namespace: Optional[str]) -> List[CodeDefinition]:
-        """
-        Find all interfaces in the content.
-
-        Args:
-            content: The content of the file.
-            file_path: The path to the file.
-            namespace: The namespace of the file.
-
-        Returns:
-            List[CodeDefinition]: A list of interface definitions.
-        """
-        definitions = []
+        # Find the end of the container (matching braces)
+        container_end = brace_index.block_end(opening_brace)
+        container_end_line = self.line_number_at(line_index, container_end)
         
-        for match in self.interface_pattern.finditer(content):
-            interface_name = match.group(1)
-            interface_start = match.start()
-            interface_line = self.find_line_number(content, interface_start)
-            
-            # Find the opening brace
-            opening_brace = content.find("{", interface_start)
-            if opening_brace == -1:
-                continue
-            
-            # Find the end of the interface (matching braces)
-            interface_end = self.find_block_end(content, opening_brace, "{", "}")
-            interface_content = content[interface_start:interface_end]
-            interface_end_line = interface_line + interface_content.count("\n")
-            
-            # Extract docstring
-            docstring = self._extract_php_docstring(content, interface_start)
-            
-            # Create interface definition
-            full_name = f"{namespace}\\{interface_name}" if namespace else interface_name
-            interface_def = CodeDefinition(
-                name=full_name,
-                type="interface",
-                file_path=file_path,
-                line_number=interface_line,
-                end_line_number=interface_end_line,
-                signature=match.group(0),
-                docstring=docstring
-            )
-            
-            # Find all methods in the interface
-            methods = self._find_class_methods(interface_content, file_path, full_name, interface_start)
-            for method in methods:
-                interface_def.children.append(method.name)
-                definitions.append(method)
-            
-            definitions.append(interface_def)
+        # Extract docstring (PHP uses /** */ or // comments)
+        docstring = self._extract_php_docstring(content, container_start, doc_index)
         
-        return definitions
-
-    def _find_traits(self, content: str, file_path: str, namespace: Optional[str]) -> List[CodeDefinition]:
-        """
-        Find all traits in the content.
-
-        Args:
-            content: The content of the file.
-            file_path: The path to the file.
-            namespace: The namespace of the file.
-
-        Returns:
-            List[CodeDefinition]: A list of trait definitions.
-        """
-        definitions = []
+        # Create container definition
+        full_name = f"{namespace}\\{container_name}" if namespace else container_name
+        container_def = CodeDefinition(
+            name=full_name,
+            type=_CONTAINER_TYPES[kind],
+            file_path=file_path,
+            line_number=container_line,
+            end_line_number=container_end_line,
+            signature=content[container_start:match.end()],
+            docstring=docstring
+        )
         
-        for match in self.trait_pattern.finditer(content):
-            trait_name = match.group(1)
-            trait_start = match.start()
-            trait_line = self.find_line_number(content, trait_start)
-            
-            # Find the opening brace
-            opening_brace = content.find("{", trait_start)
-            if opening_brace == -1:
-                continue
-            
-            # Find the end of the trait (matching braces)
-            trait_end = self.find_block_end(content, opening_brace, "{", "}")
-            trait_content = content[trait_start:trait_end]
-            trait_end_line = trait_line + trait_content.count("\n")
-            
-            # Extract docstring
-            docstring = self._extract_php_docstring(content, trait_start)
-            
-            # Create trait definition
-            full_name = f"{namespace}\\{trait_name}" if namespace else trait_name
-            trait_def = CodeDefinition(
-                name=full_name,
-                type="trait",
-                file_path=file_path,
-                line_number=trait_line,
-                end_line_number=trait_end_line,
-                signature=match.group(0),
-                docstring=docstring
-            )
-            
-            # Find all methods in the trait
-            methods = self._find_class_methods(trait_content, file_path, full_name, trait_start)
-            for method in methods:
-                trait_def.children.append(method.name)
-                definitions.append(method)
-            
-            # Find all properties in the trait
-            properties = self._find_class_properties(trait_content, file_path, full_name, trait_start)
-            for prop in properties:
-                trait_def.children.append(prop.name)
-                definitions.append(prop)
-            
-            definitions.append(trait_def)
+        # Find all methods in the container
+        methods = self._find_class_methods(content, scrubbed, container_start, container_end, file_path, full_name,
+                                           line_index, brace_index, doc_index)
+        container_def.children.extend(method.name for method in methods)
+        definitions.extend(methods)
         
-        return definitions
+        # Find all properties in the container (interfaces have none)
+        if kind != "iface":
+            properties = self._find_class_properties(content, scrubbed, container_start, container_end, file_path,
+                                                     full_name, line_index, semicolon_index, doc_index)
+            container_def.children.extend(prop.name for prop in properties)
+            definitions.extend(properties)
+        
+        definitions.append(container_def)
+        return container_end
 
-    def _find_functions(self, content: str, file_path: str, namespace: Optional[str]) -> List[CodeDefinition]:
+    def _handle_function(self, match: Match, content: str, file_path: str,
+                         namespace: Optional[str], line_index: List[int], brace_index: BraceIndex,
+                         doc_index: Tuple[List[int], List[str]], definitions: List[CodeDefinition]) -> None:
         """
-        Find all top-level functions in the content.
+        Handle a top-level function match.
 
         Args:
+            match: The top-level match for the function.
             content: The content of the file.
             file_path: The path to the file.
             namespace: The namespace of the file.
-
-        Returns:
-            List[CodeDefinition]: A list of function definitions.
+            line_index: Newline offsets for the content.
+            brace_index: Brace-depth index for the content.
+            doc_index: Docblock end offsets and texts for the content.
+            definitions: The list to append definitions to.
         """
-        definitions = []
+        function_name = match.group("func_name")
+        function_start = match.start()
+        function_line = self.line_number_at(line_index, function_start)
         
-        for match in self.function_pattern.finditer(content):
-            # Check if this function is inside a class, interface, or trait
-            function_start = match.start()
-            
-            # Skip if inside a class, interface, or trait
-            if self._is_inside_class_or_interface(content, function_start):
-                continue
-            
-            function_name = match.group(1)
-            function_line = self.find_line_number(content, function_start)
-            
-            # Find the opening brace
-            opening_brace = content.find("{", function_start)
-            if opening_brace == -1:
-                continue
-            
-            # Find the end of the function (matching braces)
-            function_end = self.find_block_end(content, opening_brace, "{", "}")
-            function_content = content[function_start:function_end]
-            function_end_line = function_line + function_content.count("\n")
-            
-            # Extract docstring
-            docstring = self._extract_php_docstring(content, function_start)
-            
-            # Create function definition
-            full_name = f"{namespace}\\{function_name}" if namespace else function_name
-            function_def = CodeDefinition(
-                name=full_name,
-                type="function",
-                file_path=file_path,
-                line_number=function_line,
-                end_line_number=function_end_line,
-                signature=match.group(0),
-                docstring=docstring
-            )
-            
-            definitions.append(function_def)
+        # Find the opening brace
+        opening_brace = brace_index.next_open(function_start)
+        if opening_brace == -1:
+            return
         
-        return definitions
+        # Find the end of the function (matching braces)
+        function_end = brace_index.block_end(opening_brace)
+        function_end_line = self.line_number_at(line_index, function_end)
+        
+        # Extract docstring
+        docstring = self._extract_php_docstring(content, function_start, doc_index)
+        
+        # Create function definition
+        full_name = f"{namespace}\\{function_name}" if namespace else function_name
+        function_def = CodeDefinition(
+            name=full_name,
+            type="function",
+            file_path=file_path,
+            line_number=function_line,
+            end_line_number=function_end_line,
+            signature=content[function_start:match.end()],
+            docstring=docstring
+        )
+        
+        definitions.append(function_def)
 
-    def _find_class_methods(self, class_content: str, file_path: str, class_name: str, class_start: int) -> List[CodeDefinition]:
+    def _find_class_methods(self, content: str, scrubbed: str, start: int, end: int, file_path: str,
+                            class_name: str, line_index: List[int], brace_index: BraceIndex,
+                            doc_index: Tuple[List[int], List[str]]) -> List[CodeDefinition]:
         """
         Find all methods in a class.
 
+        The class is addressed by its (start, end) span in the original
+        content rather than a sliced copy.
+
         Args:
-            class_content: The content of the class.
+            content: The content of the file.
+            scrubbed: The masked view of the content.
+            start: The start position of the class.
+            end: The end position of the class.
             file_path: The path to the file.
             class_name: The name of the class.
-            class_start: The start position of the class in the original content.
+            line_index: Newline offsets for the content.
+            brace_index: Brace-depth index for the content.
+            doc_index: Docblock end offsets and texts for the content.
 
         Returns:
             List[CodeDefinition]: A list of method definitions.
         """
         definitions = []
+        append = definitions.append
         
-        for match in self.method_pattern.finditer(class_content):
+        for match in _METHOD_RE.finditer(scrubbed, start, end):
             method_name = match.group(1)
-            method_start_in_class = match.start()
-            method_start = class_start + method_start_in_class
-            method_line = self.find_line_number(class_content, method_start_in_class)
+            method_start = match.start()
+            method_line = self.line_number_at(line_index, method_start)
             
             # Find the opening brace
-            opening_brace = class_content.find("{", method_start_in_class)
-            if opening_brace == -1:
+            opening_brace = brace_index.next_open(method_start)
+            if opening_brace == -1 or opening_brace >= end:
                 continue
             
             # Find the end of the method (matching braces)
-            method_end_in_class = self.find_block_end(class_content, opening_brace, "{", "}")
-            method_content = class_content[method_start_in_class:method_end_in_class]
-            method_end_line = method_line + method_content.count("\n")
+            method_end = min(brace_index.block_end(opening_brace), end)
+            method_end_line = self.line_number_at(line_index, method_end)
             
             # Extract docstring
-            docstring = self._extract_php_docstring(class_content, method_start_in_class)
+            docstring = self._extract_php_docstring(content, method_start, doc_index)
             
             # Create method definition
             method_def = CodeDefinition(
@@ -340,44 +294,57 @@ class PHPParser(BaseParser):
                 file_path=file_path,
                 line_number=method_line,
                 end_line_number=method_end_line,
-                signature=match.group(0),
+                signature=content[method_start:match.end()].strip(),
                 docstring=docstring,
                 parent=class_name
             )
             
-            definitions.append(method_def)
+            append(method_def)
         
         return definitions
 
-    def _find_class_properties(self, class_content: str, file_path: str, class_name: str, class_start: int) -> List[CodeDefinition]:
+    def _find_class_properties(self, content: str, scrubbed: str, start: int, end: int, file_path: str,
+                               class_name: str, line_index: List[int], semicolon_index: List[int],
+                               doc_index: Tuple[List[int], List[str]]) -> List[CodeDefinition]:
         """
         Find all properties in a class.
 
+        The class is addressed by its (start, end) span in the original
+        content rather than a sliced copy.
+
         Args:
-            class_content: The content of the class.
+            content: The content of the file.
+            scrubbed: The masked view of the content.
+            start: The start position of the class.
+            end: The end position of the class.
             file_path: The path to the file.
             class_name: The name of the class.
-            class_start: The start position of the class in the original content.
+            line_index: Newline offsets for the content.
+            semicolon_index: Semicolon offsets for the content.
+            doc_index: Docblock end offsets and texts for the content.
 
         Returns:
             List[CodeDefinition]: A list of property definitions.
         """
         definitions = []
+        append = definitions.append
         
-        for match in self.property_pattern.finditer(class_content):
+        for match in _PROPERTY_RE.finditer(scrubbed, start, end):
             property_name = match.group(1)
-            property_start_in_class = match.start()
-            property_line = self.find_line_number(class_content, property_start_in_class)
+            property_start = match.start()
+            property_line = self.line_number_at(line_index, property_start)
             
             # Find the end of the property (semicolon)
-            property_end_in_class = class_content.find(";", property_start_in_class)
-            if property_end_in_class == -1:
-                property_end_in_class = len(class_content)
+            idx = bisect_left(semicolon_index, property_start)
+            if idx < len(semicolon_index) and semicolon_index[idx] < end:
+                property_end = semicolon_index[idx]
+            else:
+                property_end = end
             
-            property_content = class_content[property_start_in_class:property_end_in_class+1]
+            property_content = content[property_start:property_end + 1]
             
             # Extract docstring
-            docstring = self._extract_php_docstring(class_content, property_start_in_class)
+            docstring = self._extract_php_docstring(content, property_start, doc_index)
             
             # Create property definition
             property_def = CodeDefinition(
@@ -391,75 +358,78 @@ class PHPParser(BaseParser):
                 parent=class_name
             )
             
-            definitions.append(property_def)
+            append(property_def)
         
         return definitions
 
-    def _is_inside_class_or_interface(self, content: str, position: int) -> bool:
+    @staticmethod
+    def _build_doc_index(content: str) -> Tuple[List[int], List[str]]:
         """
-        Check if a position is inside a class, interface, or trait.
+        Index every docblock comment in the content.
+
+        Built once per scan so that per-definition docstring lookups are a
+        bisect over the end offsets instead of a fresh search of everything
+        before the definition.
 
         Args:
             content: The content of the file.
-            position: The position to check.
 
         Returns:
-            bool: True if the position is inside a class, interface, or trait, False otherwise.
+            Tuple[List[int], List[str]]: The end offset and stripped text of
+                every docblock, in order.
         """
-        # Count the number of opening and closing braces before the position
-        open_braces = content[:position].count("{")
-        close_braces = content[:position].count("}")
-        
-        # Check if there are any class, interface, or trait definitions before the position
-        class_matches = list(self.class_pattern.finditer(content[:position]))
-        interface_matches = list(self.interface_pattern.finditer(content[:position]))
-        trait_matches = list(self.trait_pattern.finditer(content[:position]))
-        
-        # If there are no class, interface, or trait definitions, it's not inside any of them
-        if not class_matches and not interface_matches and not trait_matches:
-            return False
-        
-        # If the number of opening braces is greater than the number of closing braces,
-        # and there's at least one class, interface, or trait definition, it's inside one of them
-        return open_braces > close_braces
-
-    def _extract_php_docstring(self, content: str, start_pos: int) -> Optional[str]:
+        ends: List[int] = []
+        texts: List[str] = []
+        for match in _DOCSTRING_RE.finditer(content):
+            ends.append(match.end())
+            texts.append(match.group(1).strip())
+        return ends, texts
+
+    @staticmethod
+    def _extract_php_docstring(content: str, start_pos: int, doc_index: Tuple[List[int], List[str]]) -> Optional[str]:
         """
         Extract a PHP docstring (comment) before a definition.
 
         Args:
             content: The content of the file.
             start_pos: The position of the definition.
+            doc_index: Docblock end offsets and texts from _build_doc_index.
 
         Returns:
             Optional[str]: The extracted docstring, or None if not found.
         """
         # Find the line start
-        line_start = content[:start_pos].rfind("\n") + 1
-        if line_start < 0:
-            line_start = 0
+        line_start = content.rfind("\n", 0, start_pos) + 1
         
-        # Look for docblock comments before the definition
-        docblock_match = self.docstring_pattern.search(content[:start_pos], re.DOTALL)
-        if docblock_match and docblock_match.end() > line_start - 10:  # Allow some whitespace
-            return docblock_match.group(1).strip()
+        # Look for the nearest docblock comment ending just before the definition
+        ends, texts = doc_index
+        idx = bisect_right(ends, start_pos) - 1
+        if idx >= 0 and ends[idx] > line_start - 10:  # Allow some whitespace
+            return texts[idx]
+        
+        # Fast path: no inline comment marker in a short window above the
+        # definition means the backward walk below cannot find anything
+        if content.find("//", max(0, line_start - 512), line_start) == -1:
+            return None
         
         # Look for inline comments before the definition
-        comment_block = []
+        # appendleft is O(1); inserting at the front of a list shifts the
+        # whole block on every comment line
+        comment_block = deque()
         current_pos = line_start
         
         # Go backward to find comments
         while current_pos > 0:
-            prev_line_end = content[:current_pos-1].rfind("\n")
+            prev_line_end = content.rfind("\n", 0, current_pos - 1)
             if prev_line_end < 0:
                 prev_line_end = 0
             
             prev_line = content[prev_line_end:current_pos-1].strip()
             
             # Check if the previous line is a comment
-            inline_match = self.inline_comment_pattern.match(prev_line)
+            inline_match = _INLINE_COMMENT_RE.match(prev_line)
             if inline_match:
-                comment_block.insert(0, inline_match.group(1).strip())
+                comment_block.appendleft(inline_match.group(1).strip())
                 current_pos = prev_line_end + 1
             else:
                 break
@@ -468,3 +438,7 @@ class PHPParser(BaseParser):
             return "\n".join(comment_block)
         
         return None
+
+
+# Register the parser
+parser_registry.register(["php"], PHPParser)
@@ -1,12 +1,36 @@
 """
 Python code parser.
 """
+import ast
 import re
-from typing import List, Match, Optional, Tuple
+from functools import lru_cache
+from typing import List, Match, Optional, Pattern, Tuple
 
 from ...types.file_types import CodeDefinition
 from .base import BaseParser
-from .registry import ParserRegistry
+from .registry import parser_registry
+
+
+_CLASS_RE = re.compile(r"class\s+(\w+)(?:\s*\(([^)]*)\))?\s*:")
+_FUNCTION_RE = re.compile(r"def\s+(\w+)\s*\(([^)]*)\)\s*(?:->.*?)?:")
+_DOCSTRING_RE = re.compile(r'"""(.*?)"""', re.DOTALL)
+
+
+@lru_cache(maxsize=16)
+def _method_pattern(method_indent: int) -> "Pattern[str]":
+    """
+    Get the method pattern for a given indentation level.
+
+    Classes overwhelmingly share a handful of indentation levels, so the
+    compiled patterns are memoized instead of recompiled per class.
+
+    Args:
+        method_indent: The indentation of the class body in spaces.
+
+    Returns:
+        Pattern[str]: The compiled method pattern.
+    """
+    return re.compile(r"^( {" + str(method_indent) + r"}|\t)def\s+(\w+)\s*\(([^)]*)\)\s*(?:->.*?)?:", re.MULTILINE)
 
 
 class PythonParser(BaseParser):
@@ -14,17 +38,95 @@ class PythonParser(BaseParser):
     Parser for Python code.
     """
 
-    def __init__(self):
-        """Initialize the Python parser."""
-        super().__init__()
-        self.class_pattern = re.compile(r"class\s+(\w+)(?:\s*\(([^)]*)\))?\s*:")
-        self.function_pattern = re.compile(r"def\s+(\w+)\s*\(([^)]*)\)\s*(?:->.*?)?:")
-        self.docstring_pattern = re.compile(r'"""(.*?)"""', re.DOTALL)
+    # All patterns live at module level, compiled once per process instead of
+    # once per instance, so instances need no attribute storage at all.
+    __slots__ = ()
 
     def parse(self, content: str, file_path: str) -> List[CodeDefinition]:
         """
         Parse Python code and extract definitions.
 
+        The compiled ast module does the tokenizing and gives exact start
+        and end lines plus docstrings for free, which the regex scan could
+        only approximate (nested defs, decorators, multi-line signatures and
+        strings containing "def" all fooled it). Sources the running
+        interpreter cannot parse fall back to the regex scan.
+
+        Args:
+            content: The content of the file.
+            file_path: The path to the file.
+
+        Returns:
+            List[CodeDefinition]: A list of code definitions.
+        """
+        try:
+            tree = ast.parse(content)
+        except (SyntaxError, ValueError):
+            # Not parseable as current-version Python; approximate with the
+            # regex scan rather than returning nothing
+            return self._parse_with_regex(content, file_path)
+        
+        lines = content.splitlines()
+        definitions: List[CodeDefinition] = []
+        self._visit_body(tree.body, lines, file_path, None, False, definitions)
+        return definitions
+
+    def _visit_body(self, body: List[ast.stmt], lines: List[str], file_path: str,
+                    parent: Optional[str], parent_is_class: bool,
+                    definitions: List[CodeDefinition]) -> List[str]:
+        """
+        Collect definitions from a list of statements, recursively.
+
+        Args:
+            body: The statements to visit.
+            lines: The content of the file, split into lines.
+            file_path: The path to the file.
+            parent: The name of the enclosing class or function, if any.
+            parent_is_class: Whether the enclosing scope is a class body.
+            definitions: The list to append definitions to.
+
+        Returns:
+            List[str]: The names defined directly in this body.
+        """
+        names: List[str] = []
+        for node in body:
+            if isinstance(node, ast.ClassDef):
+                class_def = CodeDefinition(
+                    name=node.name,
+                    type="class",
+                    file_path=file_path,
+                    line_number=node.lineno,
+                    end_line_number=node.end_lineno,
+                    signature=lines[node.lineno - 1].strip(),
+                    docstring=ast.get_docstring(node),
+                    parent=parent
+                )
+                children = self._visit_body(node.body, lines, file_path, node.name, True, definitions)
+                class_def.children.extend(children)
+                definitions.append(class_def)
+                names.append(node.name)
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                definitions.append(CodeDefinition(
+                    name=node.name,
+                    type="method" if parent_is_class else "function",
+                    file_path=file_path,
+                    line_number=node.lineno,
+                    end_line_number=node.end_lineno,
+                    signature=lines[node.lineno - 1].strip(),
+                    docstring=ast.get_docstring(node),
+                    parent=parent
+                ))
+                self._visit_body(node.body, lines, file_path, node.name, False, definitions)
+                names.append(node.name)
+        return names
+
+    def _parse_with_regex(self, content: str, file_path: str) -> List[CodeDefinition]:
+        """
+        Parse Python code with the regex scan.
+
+        Fallback for sources ast cannot parse (syntax errors, other Python
+        versions).
+
         Args:
             content: The content of the file.
             file_path: The path to the file.
@@ -34,43 +136,48 @@ class PythonParser(BaseParser):
         """
         definitions = []
         
+        # Newline offsets computed once; line-number lookups below are a
+        # bisect on this index instead of a scan over the content.
+        line_index = self.build_line_index(content)
+        
         # Find all classes
-        definitions.extend(self._find_classes(content, file_path))
+        definitions.extend(self._find_classes(content, file_path, line_index))
         
         # Find all top-level functions (not methods)
-        definitions.extend(self._find_functions(content, file_path))
+        definitions.extend(self._find_functions(content, file_path, line_index))
         
         return definitions
 
-    def _find_classes(self, content: str, file_path: str) -> List[CodeDefinition]:
+    def _find_classes(self, content: str, file_path: str, line_index: List[int]) -> List[CodeDefinition]:
         """
         Find all classes in the content.
 
         Args:
             content: The content of the file.
             file_path: The path to the file.
+            line_index: Newline offsets for the content.
 
         Returns:
             List[CodeDefinition]: A list of class definitions.
         """
         definitions = []
         
-        for match in self.class_pattern.finditer(content):
+        for match in _CLASS_RE.finditer(content):
             class_name = match.group(1)
             class_start = match.start()
-            class_line = self.find_line_number(content, class_start)
+            class_line = self.line_number_at(line_index, class_start)
             
             # Find the end of the class
             class_end = len(content)
-            next_class_match = self.class_pattern.search(content[class_start + 1:])
+            next_class_match = _CLASS_RE.search(content[class_start + 1:])
             if next_class_match:
                 class_end = class_start + 1 + next_class_match.start()
             
             class_content = content[class_start:class_end]
-            class_end_line = class_line + class_content.count("\n")
+            class_end_line = self.line_number_at(line_index, class_end)
             
             # Extract docstring
-            docstring = self.extract_docstring(class_content, self.docstring_pattern, 0)
+            docstring = self.extract_docstring(class_content, _DOCSTRING_RE, 0)
             
             # Create class definition
             class_def = CodeDefinition(
@@ -84,7 +191,7 @@ class PythonParser(BaseParser):
             )
             
             # Find all methods in the class
-            methods = self._find_methods(class_content, file_path, class_name, class_start)
+            methods = self._find_methods(class_content, file_path, class_name, class_start, line_index)
             for method in methods:
                 class_def.children.append(method.name)
                 definitions.append(method)
@@ -93,7 +200,8 @@ class PythonParser(BaseParser):
         
         return definitions
 
-    def _find_methods(self, class_content: str, file_path: str, class_name: str, class_start: int) -> List[CodeDefinition]:
+    def _find_methods(self, class_content: str, file_path: str, class_name: str, class_start: int,
+                      line_index: List[int]) -> List[CodeDefinition]:
         """
         Find all methods in a class.
 
@@ -102,6 +210,7 @@ class PythonParser(BaseParser):
             file_path: The path to the file.
             class_name: The name of the class.
             class_start: The start position of the class in the original content.
+            line_index: Newline offsets for the content.
 
         Returns:
             List[CodeDefinition]: A list of method definitions.
@@ -116,28 +225,28 @@ class PythonParser(BaseParser):
         first_line = class_content[:first_line_end]
         class_indent = len(first_line) - len(first_line.lstrip())
         
-        # Create a pattern for methods with the correct indentation
+        # Get the (memoized) pattern for methods with the correct indentation
         method_indent = class_indent + 4  # Python standard is 4 spaces
-        method_pattern = re.compile(r"^( {" + str(method_indent) + r"}|\t)def\s+(\w+)\s*\(([^)]*)\)\s*(?:->.*?)?:", re.MULTILINE)
+        method_pattern = _method_pattern(method_indent)
         
         for match in method_pattern.finditer(class_content):
             method_name = match.group(2)
             method_start_in_class = match.start()
             method_start = class_start + method_start_in_class
-            method_line = self.find_line_number(class_content, method_start_in_class)
+            method_line = self.line_number_at(line_index, method_start)
             
             # Find the end of the method
-            next_method_match = method_pattern.search(class_content[method_start_in_class + 1:])
+            next_method_match = method_pattern.search(class_content, method_start_in_class + 1)
             if next_method_match:
-                method_end_in_class = method_start_in_class + 1 + next_method_match.start()
-                method_content = class_content[method_start_in_class:method_end_in_class]
+                method_end_in_class = next_method_match.start()
             else:
-                method_content = class_content[method_start_in_class:]
+                method_end_in_class = len(class_content)
+            method_content = class_content[method_start_in_class:method_end_in_class]
             
-            method_end_line = method_line + method_content.count("\n")
+            method_end_line = self.line_number_at(line_index, class_start + method_end_in_class)
             
             # Extract docstring
-            docstring = self.extract_docstring(method_content, self.docstring_pattern, 0)
+            docstring = self.extract_docstring(method_content, _DOCSTRING_RE, 0)
             
             # Create method definition
             method_def = CodeDefinition(
@@ -155,20 +264,21 @@ class PythonParser(BaseParser):
         
         return definitions
 
-    def _find_functions(self, content: str, file_path: str) -> List[CodeDefinition]:
+    def _find_functions(self, content: str, file_path: str, line_index: List[int]) -> List[CodeDefinition]:
         """
         Find all top-level functions in the content.
 
         Args:
             content: The content of the file.
             file_path: The path to the file.
+            line_index: Newline offsets for the content.
 
         Returns:
             List[CodeDefinition]: A list of function definitions.
         """
         definitions = []
         
-        for match in self.function_pattern.finditer(content):
+        for match in _FUNCTION_RE.finditer(content):
             # Check if this is a method (indented)
             line_start = content[:match.start()].rfind("\n") + 1
             if line_start >= 0 and content[line_start:match.start()].strip():
@@ -176,11 +286,11 @@ class PythonParser(BaseParser):
             
             function_name = match.group(1)
             function_start = match.start()
-            function_line = self.find_line_number(content, function_start)
+            function_line = self.line_number_at(line_index, function_start)
             
             # Find the end of the function
             function_end = len(content)
-            next_function_match = self.function_pattern.search(content[function_start + 1:])
+            next_function_match = _FUNCTION_RE.search(content[function_start + 1:])
             if next_function_match:
                 # Check if the next function is at the same indentation level
                 next_function_start = function_start + 1 + next_function_match.start()
@@ -189,10 +299,10 @@ class PythonParser(BaseParser):
                     function_end = next_function_start
             
             function_content = content[function_start:function_end]
-            function_end_line = function_line + function_content.count("\n")
+            function_end_line = self.line_number_at(line_index, function_end)
             
             # Extract docstring
-            docstring = self.extract_docstring(function_content, self.docstring_pattern, 0)
+            docstring = self.extract_docstring(function_content, _DOCSTRING_RE, 0)
             
             # Create function definition
             function_def = CodeDefinition(
@@ -211,5 +321,4 @@ class PythonParser(BaseParser):
 
 
 # Register the parser
-parser_registry = ParserRegistry()
 parser_registry.register(["py"], PythonParser)
@@ -20,12 +20,19 @@ class ParserRegistry:
         """
         Register a parser for the given file extensions.
 
+        Parsers are stateless and tiny, so one instance is created eagerly
+        here and shared by all the extensions it handles; get_parser then
+        needs no lazy-init branch on its per-file fast path.
+
         Args:
             extensions: List of file extensions (without the dot).
             parser_class: The parser class to register.
         """
+        instance = parser_class()
         for ext in extensions:
-            self._parsers[ext.lower()] = parser_class
+            ext = ext.lower()
+            self._parsers[ext] = parser_class
+            self._instances[ext] = instance
 
     def get_parser(self, file_extension: str) -> Optional[BaseParser]:
         """
@@ -37,15 +44,7 @@ class ParserRegistry:
         Returns:
             Optional[BaseParser]: The parser for the given file extension, or None if not found.
         """
-        ext = file_extension.lower()
-        if ext not in self._parsers:
-            return None
-
-        # Lazy instantiation of parsers
-        if ext not in self._instances:
-            self._instances[ext] = self._parsers[ext]()
-
-        return self._instances[ext]
+        return self._instances.get(file_extension.lower())
 
     def get_supported_extensions(self) -> List[str]:
         """
@@ -55,3 +54,9 @@ class ParserRegistry:
             List[str]: A list of supported file extensions.
         """
         return list(self._parsers.keys())
+
+
+# Shared registry instance. Parser modules register against this singleton so
+# that all registrations end up in one place instead of each module creating
+# (and immediately discarding) its own registry.
+parser_registry = ParserRegistry()
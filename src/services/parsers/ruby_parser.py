@@ -2,10 +2,57 @@
 Ruby code parser.
 """
 import re
-from typing import List, Match, Optional, Tuple
+import sys
+from bisect import bisect_left
+from typing import List, Optional
 
 from ...types.file_types import CodeDefinition
 from .base import BaseParser
+from .registry import parser_registry
+
+
+# Every construct the parser reacts to, fused into one alternation so the
+# content is scanned once instead of once per kind. The outer named group of
+# each branch identifies the kind via match.lastgroup; the open and end
+# branches carry no definition but drive the block stack that tracks nesting.
+_SCAN_RE = re.compile(
+    r"(?P<cls>class\s+(?P<cls_name>\w+)(?:\s*<\s*(?P<cls_super>\w+))?)"
+    r"|(?P<mod>module\s+(?P<mod_name>\w+))"
+    r"|(?P<def>def\s+(?:self\.)?(?P<def_name>\w+)(?:\((?P<def_params>[^)\n]*)\))?)"
+    r"|(?P<attr>attr(?:_reader|_writer|_accessor)[ \t]+(?P<attr_names>:\w+(?:[ \t]*,[ \t]*:\w+)*))"
+    r"|(?P<open>\b(?:if|unless|case|begin|do)\b)"
+    r"|(?P<end>\bend\b)"
+)
+
+_DOCSTRING_RE = re.compile(r'#\s*(.*?)$', re.MULTILINE)
+
+# Individual symbols inside a matched attr_* symbol list.
+_SYMBOL_RE = re.compile(r":(\w+)")
+
+# Regions blanked out before structural matching: string literals, line
+# comments and =begin/=end comment blocks. Offsets are preserved by
+# mask_regions, so a "def" or "end" inside a string or comment can neither
+# open nor close a block. Heredoc bodies are not masked; recognizing them
+# needs real lexing and they rarely contain bare block keywords at a word
+# boundary.
+_MASK_RE = re.compile(
+    r'"(?:\\.|[^"\\\n])*"'
+    r"|'(?:\\.|[^'\\\n])*'"
+    r"|#[^\n]*"
+    r"|^=begin[\s\S]*?^=end[^\n]*",
+    re.MULTILINE
+)
+
+# A run of comment lines ending exactly at the search endpos. Anchoring on
+# \Z and searching with endpos set to the definition's line start finds the
+# whole preceding comment block with one regex call.
+_DOC_BLOCK_RE = re.compile(r"(?:^[ \t]*#[^\n]*\n)+\Z", re.MULTILINE)
+# Comment markers and trailing blanks, removed from the block in one sub.
+_DOC_MARKER_RE = re.compile(r"^[ \t]*#[ \t]*|[ \t]+$", re.MULTILINE)
+
+# Cheap prescreen: a file with none of these keywords cannot contain any
+# definition this parser extracts.
+_KEYWORD_RE = re.compile(r"\b(?:class|module|def|attr_(?:reader|writer|accessor))\b")
 
 
 class RubyParser(BaseParser):
@@ -13,19 +60,18 @@ class RubyParser(BaseParser):
     Parser for Ruby code.
     """
 
-    def __init__(self):
-        """Initialize the Ruby parser."""
-        super().__init__()
-        self.class_pattern = re.compile(r"class\s+(\w+)(?:\s*<\s*(\w+))?")
-        self.module_pattern = re.compile(r"module\s+(\w+)")
-        self.method_pattern = re.compile(r"def\s+(?:self\.)?(\w+)(?:\(([^)]*)\))?")
-        self.attr_pattern = re.compile(r"attr(?:_reader|_writer|_accessor)\s+:([\w,\s]+)")
-        self.docstring_pattern = re.compile(r'#\s*(.*?)$', re.MULTILINE)
+    # All patterns and helpers live at module level; instances are stateless.
+    __slots__ = ()
 
     def parse(self, content: str, file_path: str) -> List[CodeDefinition]:
         """
         Parse Ruby code and extract definitions.
 
+        A single pass over the content dispatches each match on its
+        alternation branch while a stack of open blocks tracks nesting, so
+        classes, modules, methods and attributes are all collected without
+        re-scanning the content per kind or slicing out container bodies.
+
         Args:
             content: The content of the file.
             file_path: The path to the file.
@@ -33,348 +79,186 @@ class RubyParser(BaseParser):
         Returns:
             List[CodeDefinition]: A list of code definitions.
         """
-        definitions = []
-        
-        # Find all classes
-        definitions.extend(self._find_classes(content, file_path))
-        
-        # Find all modules
-        definitions.extend(self._find_modules(content, file_path))
-        
-        # Find all top-level methods (not in classes or modules)
-        definitions.extend(self._find_methods(content, file_path))
-        
-        return definitions
+        # Files without a single definition keyword skip the line index and
+        # the full scan entirely.
+        if _KEYWORD_RE.search(content) is None:
+            return []
 
-    def _find_classes(self, content: str, file_path: str) -> List[CodeDefinition]:
-        """
-        Find all classes in the content.
+        # Definitions of one file share the path, container names and the
+        # child-name copies kept on containers; interning keeps one str
+        # object per distinct name instead of one per definition.
+        file_path = sys.intern(file_path)
 
-        Args:
-            content: The content of the file.
-            file_path: The path to the file.
+        definitions: List[CodeDefinition] = []
 
-        Returns:
-            List[CodeDefinition]: A list of class definitions.
-        """
-        definitions = []
-        
-        for match in self.class_pattern.finditer(content):
-            class_name = match.group(1)
-            class_start = match.start()
-            class_line = self.find_line_number(content, class_start)
-            
-            # Find the end of the class (end keyword)
-            class_end = self._find_ruby_block_end(content, class_start, "class")
-            class_content = content[class_start:class_end]
-            class_end_line = class_line + class_content.count("\n")
-            
-            # Extract docstring (Ruby uses # comments)
-            docstring = self._extract_ruby_docstring(content, class_start)
-            
-            # Create class definition
-            class_def = CodeDefinition(
-                name=class_name,
-                type="class",
-                file_path=file_path,
-                line_number=class_line,
-                end_line_number=class_end_line,
-                signature=match.group(0),
-                docstring=docstring
-            )
-            
-            # Find all methods in the class
-            methods = self._find_class_methods(class_content, file_path, class_name, class_start)
-            for method in methods:
-                class_def.children.append(method.name)
-                definitions.append(method)
-            
-            # Find all attributes in the class
-            attributes = self._find_class_attributes(class_content, file_path, class_name, class_start)
-            for attr in attributes:
-                class_def.children.append(attr.name)
-                definitions.append(attr)
-            
-            definitions.append(class_def)
-        
-        return definitions
+        # Newline offsets computed once; every line-number lookup and the
+        # docstring walk below resolve against this index by bisect instead
+        # of scanning the content.
+        line_index = self.build_line_index(content)
 
-    def _find_modules(self, content: str, file_path: str) -> List[CodeDefinition]:
-        """
-        Find all modules in the content.
+        # Structural matching runs against a masked twin of the content with
+        # strings and comments blanked out, so block keywords inside literals
+        # or comments cannot open or close frames. Offsets in the masked view
+        # equal offsets in the original.
+        scrubbed = self.mask_regions(content, _MASK_RE)
 
-        Args:
-            content: The content of the file.
-            file_path: The path to the file.
+        # Stack of open blocks: the CodeDefinition opened by the block, or
+        # None for if/unless/case/begin/do blocks that consume an "end"
+        # without producing a definition. container_stack mirrors the subset
+        # of frames that are classes or modules, for parent attribution.
+        stack: List[Optional[CodeDefinition]] = []
+        container_stack: List[CodeDefinition] = []
 
-        Returns:
-            List[CodeDefinition]: A list of module definitions.
-        """
-        definitions = []
-        
-        for match in self.module_pattern.finditer(content):
-            module_name = match.group(1)
-            module_start = match.start()
-            module_line = self.find_line_number(content, module_start)
-            
-            # Find the end of the module (end keyword)
-            module_end = self._find_ruby_block_end(content, module_start, "module")
-            module_content = content[module_start:module_end]
-            module_end_line = module_line + module_content.count("\n")
-            
-            # Extract docstring
-            docstring = self._extract_ruby_docstring(content, module_start)
-            
-            # Create module definition
-            module_def = CodeDefinition(
-                name=module_name,
-                type="module",
-                file_path=file_path,
-                line_number=module_line,
-                end_line_number=module_end_line,
-                signature=match.group(0),
-                docstring=docstring
-            )
-            
-            # Find all methods in the module
-            methods = self._find_class_methods(module_content, file_path, module_name, module_start)
-            for method in methods:
-                module_def.children.append(method.name)
-                definitions.append(method)
-            
-            definitions.append(module_def)
-        
-        return definitions
+        # Bind hot attributes to locals; LOAD_FAST is measurably cheaper than
+        # repeated attribute lookups inside the match loop.
+        extract_docstring = self._extract_ruby_docstring
+        append_definition = definitions.append
+        content_find = content.find
 
-    def _find_methods(self, content: str, file_path: str) -> List[CodeDefinition]:
-        """
-        Find all top-level methods in the content.
+        # Positions handed to line_at never decrease during the scan (the
+        # only lookup past a match is the end of its own line, and no newline
+        # sits between a match and that point), so line numbers resolve with
+        # a forward-only cursor over the newline index: O(n + d) for the
+        # whole file instead of a bisect per lookup.
+        line_cursor = 0
+        line_count = len(line_index)
 
-        Args:
-            content: The content of the file.
-            file_path: The path to the file.
+        def line_at(position: int) -> int:
+            nonlocal line_cursor
+            while line_cursor < line_count and line_index[line_cursor] < position:
+                line_cursor += 1
+            return line_cursor + 1
 
-        Returns:
-            List[CodeDefinition]: A list of method definitions.
-        """
-        definitions = []
-        
-        for match in self.method_pattern.finditer(content):
-            # Check if this method is inside a class or module
-            method_start = match.start()
-            
-            # Skip if inside a class or module
-            if self._is_inside_class_or_module(content, method_start):
-                continue
-            
-            method_name = match.group(1)
-            method_line = self.find_line_number(content, method_start)
-            
-            # Find the end of the method (end keyword)
-            method_end = self._find_ruby_block_end(content, method_start, "def")
-            method_content = content[method_start:method_end]
-            method_end_line = method_line + method_content.count("\n")
-            
-            # Extract docstring
-            docstring = self._extract_ruby_docstring(content, method_start)
-            
-            # Create method definition
-            method_def = CodeDefinition(
-                name=method_name,
-                type="function",  # Top-level methods are considered functions
-                file_path=file_path,
-                line_number=method_line,
-                end_line_number=method_end_line,
-                signature=match.group(0),
-                docstring=docstring
-            )
-            
-            definitions.append(method_def)
-        
-        return definitions
+        for match in _SCAN_RE.finditer(scrubbed):
+            kind = match.lastgroup
 
-    def _find_class_methods(self, class_content: str, file_path: str, class_name: str, class_start: int) -> List[CodeDefinition]:
-        """
-        Find all methods in a class.
+            if kind == "end":
+                if not stack:
+                    continue
+                frame = stack.pop()
+                if frame is None:
+                    continue
+                # The block ends at the end of the line holding "end"
+                line_end = content_find("\n", match.end())
+                end_pos = line_end if line_end != -1 else len(content)
+                frame.end_line_number = line_at(end_pos)
+                if container_stack and container_stack[-1] is frame:
+                    container_stack.pop()
+                append_definition(frame)
 
-        Args:
-            class_content: The content of the class.
-            file_path: The path to the file.
-            class_name: The name of the class.
-            class_start: The start position of the class in the original content.
-
-        Returns:
-            List[CodeDefinition]: A list of method definitions.
-        """
-        definitions = []
-        
-        for match in self.method_pattern.finditer(class_content):
-            method_name = match.group(1)
-            method_start_in_class = match.start()
-            method_start = class_start + method_start_in_class
-            method_line = self.find_line_number(class_content, method_start_in_class)
-            
-            # Find the end of the method (end keyword)
-            method_end_in_class = self._find_ruby_block_end(class_content, method_start_in_class, "def")
-            method_content = class_content[method_start_in_class:method_end_in_class]
-            method_end_line = method_line + method_content.count("\n")
-            
-            # Extract docstring
-            docstring = self._extract_ruby_docstring(class_content, method_start_in_class)
-            
-            # Create method definition
-            method_def = CodeDefinition(
-                name=method_name,
-                type="method",
-                file_path=file_path,
-                line_number=method_line,
-                end_line_number=method_end_line,
-                signature=match.group(0),
-                docstring=docstring,
-                parent=class_name
-            )
-            
-            definitions.append(method_def)
-        
-        return definitions
-
-    def _find_class_attributes(self, class_content: str, file_path: str, class_name: str, class_start: int) -> List[CodeDefinition]:
-        """
-        Find all attributes in a class.
+            elif kind == "open":
+                # Modifier if/unless ("return x if y") has no matching end
+                # and must not open a frame
+                token = match.group(0)
+                if token in ("if", "unless"):
+                    line_start = scrubbed.rfind("\n", 0, match.start()) + 1
+                    if scrubbed[line_start:match.start()].strip():
+                        continue
+                stack.append(None)
 
-        Args:
-            class_content: The content of the class.
-            file_path: The path to the file.
-            class_name: The name of the class.
-            class_start: The start position of the class in the original content.
+            elif kind == "cls" or kind == "mod":
+                name = sys.intern(match.group(kind + "_name"))
+                start = match.start()
+                container_def = CodeDefinition(
+                    name=name,
+                    type="class" if kind == "cls" else "module",
+                    file_path=file_path,
+                    line_number=line_at(start),
+                    end_line_number=0,  # Set when the frame is popped
+                    signature=content[start:match.end()],
+                    docstring=extract_docstring(content, line_index, start)
+                )
+                stack.append(container_def)
+                container_stack.append(container_def)
 
-        Returns:
-            List[CodeDefinition]: A list of attribute definitions.
-        """
-        definitions = []
-        
-        for match in self.attr_pattern.finditer(class_content):
-            attr_list = match.group(1)
-            attr_start_in_class = match.start()
-            attr_line = self.find_line_number(class_content, attr_start_in_class)
-            
-            # Split multiple attributes (attr_accessor :name, :age, :email)
-            for attr_name in attr_list.split(','):
-                attr_name = attr_name.strip()
-                
-                # Extract docstring
-                docstring = self._extract_ruby_docstring(class_content, attr_start_in_class)
-                
-                # Create attribute definition
-                attr_def = CodeDefinition(
-                    name=attr_name,
-                    type="attribute",
+            elif kind == "def":
+                method_name = sys.intern(match.group("def_name"))
+                start = match.start()
+                parent = container_stack[-1] if container_stack else None
+                method_def = CodeDefinition(
+                    name=method_name,
+                    type="method" if parent else "function",
                     file_path=file_path,
-                    line_number=attr_line,
-                    end_line_number=attr_line,
-                    signature=match.group(0),
-                    docstring=docstring,
-                    parent=class_name
+                    line_number=line_at(start),
+                    end_line_number=0,  # Set when the frame is popped
+                    signature=content[start:match.end()],
+                    docstring=extract_docstring(content, line_index, start),
+                    parent=parent.name if parent else None
                 )
-                
-                definitions.append(attr_def)
-        
-        return definitions
+                if parent:
+                    parent.children.append(method_name)
+                stack.append(method_def)
 
-    def _is_inside_class_or_module(self, content: str, position: int) -> bool:
-        """
-        Check if a position is inside a class or module.
+            else:  # attr
+                # Attributes outside a class or module are not definitions
+                if not container_stack:
+                    continue
+                parent = container_stack[-1]
+                attr_start = match.start()
+                attr_line = line_at(attr_start)
+                docstring = extract_docstring(content, line_index, attr_start)
 
-        Args:
-            content: The content of the file.
-            position: The position to check.
-
-        Returns:
-            bool: True if the position is inside a class or module, False otherwise.
-        """
-        # Count the number of class/module and end keywords before the position
-        class_module_count = len(re.findall(r"class\s+\w+|module\s+\w+", content[:position]))
-        end_count = len(re.findall(r"\bend\b", content[:position]))
-        
-        return class_module_count > end_count
+                # Each symbol in the list (attr_accessor :name, :age, :email)
+                # is its own match; no split, no strip, no empty leftovers
+                for symbol in _SYMBOL_RE.finditer(match.group("attr_names")):
+                    attr_name = sys.intern(symbol.group(1))
+                    attr_def = CodeDefinition(
+                        name=attr_name,
+                        type="attribute",
+                        file_path=file_path,
+                        line_number=attr_line,
+                        end_line_number=attr_line,
+                        signature=content[attr_start:match.end()],
+                        docstring=docstring,
+                        parent=parent.name
+                    )
+                    parent.children.append(attr_name)
+                    append_definition(attr_def)
 
-    def _find_ruby_block_end(self, content: str, start_pos: int, block_type: str) -> int:
-        """
-        Find the end of a Ruby block (class, module, def, etc.).
+        # Unterminated blocks run to the end of the file
+        if stack:
+            total_lines = line_at(len(content))
+            while stack:
+                frame = stack.pop()
+                if frame is not None:
+                    frame.end_line_number = total_lines
+                    definitions.append(frame)
 
-        Args:
-            content: The content of the file.
-            start_pos: The position to start searching from.
-            block_type: The type of block (class, module, def, etc.).
+        return definitions
 
-        Returns:
-            int: The position of the end of the block.
-        """
-        # Count nested blocks
-        block_count = 1
-        current_pos = start_pos
-        
-        # Skip the first line (the block definition)
-        line_end = content[current_pos:].find("\n")
-        if line_end != -1:
-            current_pos += line_end + 1
-        
-        while current_pos < len(content) and block_count > 0:
-            # Check for new blocks
-            if re.search(r"\b(class|module|def|if|unless|case|begin|do)\b", content[current_pos:current_pos+20]):
-                block_count += 1
-            
-            # Check for end keyword
-            if re.search(r"\bend\b", content[current_pos:current_pos+5]):
-                block_count -= 1
-                if block_count == 0:
-                    # Find the end of the line
-                    line_end = content[current_pos:].find("\n")
-                    if line_end != -1:
-                        return current_pos + line_end
-                    else:
-                        return len(content)
-            
-            current_pos += 1
-        
-        return len(content)
-
-    def _extract_ruby_docstring(self, content: str, start_pos: int) -> Optional[str]:
+    @staticmethod
+    def _extract_ruby_docstring(content: str, line_index: List[int], start_pos: int) -> Optional[str]:
         """
         Extract a Ruby docstring (comment) before a definition.
 
+        One anchored search over a bounded window replaces the per-line
+        backward walk: the pattern matches the whole run of comment lines
+        ending at the definition's line start, and one sub strips the
+        comment markers.
+
         Args:
             content: The content of the file.
+            line_index: Newline offsets for the content.
             start_pos: The position of the definition.
 
         Returns:
             Optional[str]: The extracted docstring, or None if not found.
         """
-        # Find the line start
-        line_start = content[:start_pos].rfind("\n") + 1
-        if line_start < 0:
-            line_start = 0
-        
-        # Look for comments before the definition
-        comment_block = []
-        current_pos = line_start
-        
-        # Go backward to find comments
-        while current_pos > 0:
-            prev_line_end = content[:current_pos-1].rfind("\n")
-            if prev_line_end < 0:
-                prev_line_end = 0
-            
-            prev_line = content[prev_line_end:current_pos-1].strip()
-            
-            # Check if the previous line is a comment
-            if prev_line.startswith("#"):
-                comment_block.insert(0, prev_line[1:].strip())
-                current_pos = prev_line_end + 1
-            else:
-                break
-        
-        if comment_block:
-            return "\n".join(comment_block)
-        
-        return None
+        # Start of the line holding the definition
+        line_idx = bisect_left(line_index, start_pos)
+        if line_idx == 0:
+            return None
+        line_start = line_index[line_idx - 1] + 1
+
+        # Comment blocks longer than the window are truncated; 4 KiB is far
+        # beyond any realistic doc comment
+        window_start = max(0, line_start - 4096)
+        block = _DOC_BLOCK_RE.search(content, window_start, line_start)
+        if block is None:
+            return None
+
+        return _DOC_MARKER_RE.sub("", block.group(0)).rstrip("\n")
+
+
+# Register the parser
+parser_registry.register(["rb"], RubyParser)
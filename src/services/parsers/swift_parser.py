@@ -6,6 +6,7 @@ from typing import List, Match, Optional, Tuple
 
 from ...types.file_types import CodeDefinition
 from .base import BaseParser
+from .registry import parser_registry
 
 
 class SwiftParser(BaseParser):
@@ -634,3 +635,7 @@ class SwiftParser(BaseParser):
             return "\n".join(comment_block)
         
         return None
+
+
+# Register the parser
+parser_registry.register(["swift"], SwiftParser)
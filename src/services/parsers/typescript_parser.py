@@ -6,7 +6,7 @@ from typing import List
 
 from ...types.file_types import CodeDefinition
 from .javascript_parser import JavaScriptParser
-from .registry import ParserRegistry
+from .registry import parser_registry
 
 
 class TypeScriptParser(JavaScriptParser):
@@ -179,5 +179,4 @@ class TypeScriptParser(JavaScriptParser):
 
 
 # Register the parser
-parser_registry = ParserRegistry()
 parser_registry.register(["ts", "tsx"], TypeScriptParser)
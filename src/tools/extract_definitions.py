@@ -108,10 +108,9 @@ class ExtractDefinitionsTool:
 
                     files.append(file_path)
 
-            # Extract definitions from each file
+            # Extract definitions from all files, in parallel for large batches
             all_definitions = []
-            for file_path in files:
-                definitions = self._code_parser_service.extract_definitions(file_path)
+            for definitions in self._code_parser_service.extract_definitions_many(files):
                 all_definitions.extend([self._format_definition(d) for d in definitions])
 
             return {
@@ -16,7 +16,7 @@ class FileType(Enum):
     SYMLINK = "symlink"
 
 
-@dataclass
+@dataclass(slots=True)
 class FileInfo:
     """Information about a file."""
     path: str
@@ -30,7 +30,7 @@ class FileInfo:
     metadata: Dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class DirectoryInfo:
     """Information about a directory."""
     path: str
@@ -41,7 +41,7 @@ class DirectoryInfo:
     metadata: Dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     """Result of a search operation."""
     file_path: str
@@ -53,9 +53,13 @@ class SearchResult:
     context_after: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class CodeDefinition:
-    """Information about a code definition (function, class, etc.)."""
+    """Information about a code definition (function, class, etc.).
+
+    Parsers emit one instance per definition — easily thousands per project
+    scan — so instances are slotted to drop the per-object __dict__.
+    """
     name: str
     type: str  # "function", "class", "method", "variable", etc.
     file_path: str
@@ -68,7 +72,7 @@ class CodeDefinition:
     metadata: Dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class CommitInfo:
     """Information about a Git commit."""
     commit_hash: str
@@ -79,14 +83,14 @@ class CommitInfo:
     changed_files: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class FileHistory:
     """History of a file."""
     file_path: str
     commits: List[CommitInfo] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectMetrics:
     """Metrics about a project."""
     total_files: int